@@ -1,10 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from typing import Optional
+
+from sierpinski.shared import RingReader
 
 class InvarianceVisualizer:
-    def __init__(self):
+    def __init__(self, source: Optional[RingReader] = None):
+        self.source = source  # Optional shared chaos game producer
         self.vertices = np.array([[0, 0], [1, 0], [0.5, 0.866]])
+        if source is not None:
+            self.vertices = np.array(source.vertices)
         self.points = []
         self.current_point = np.random.rand(2)
         
@@ -18,8 +24,13 @@ class InvarianceVisualizer:
         self.points.append(self.current_point)
         
     def update(self, frame):
-        for _ in range(10):  # Add 10 points per frame
-            self.step()
+        if self.source is not None:
+            # Take the 10 newest points of every batch published since the last frame
+            for points in self.source.points():
+                self.points.extend(points[-10:].copy())
+        else:
+            for _ in range(10):  # Add 10 points per frame
+                self.step()
         points_array = np.array(self.points)
         self.scatter.set_offsets(points_array)
         return self.scatter,
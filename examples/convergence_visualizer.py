@@ -5,6 +5,9 @@ from matplotlib.patches import Polygon
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 import logging
+import time
+
+from sierpinski.shared import RingReader
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,11 +23,34 @@ class VisualizerConfig:
     max_frames: int = 10000  # Add maximum frames limit
     theory_decay_rate: float = 15.0  # Adjusted theoretical decay rate
 
+@dataclass
+class EnsembleResult:
+    """Distance statistics of an ensemble of (point, twin) trajectories"""
+    percentiles: Tuple[float, ...]
+    distances: np.ndarray  # (iterations + 1, len(percentiles)) distance percentiles per iteration
+    geometric_mean: np.ndarray  # (iterations + 1,) geometric mean of non-zero distances
+    contraction_rate: float  # Fitted distance ratio per iteration, NaN if fewer than 2 usable iterations
+    half_life: float  # Iterations to halve the distance, comparable to theory_decay_rate
+    trajectories: int
+    seconds: float
+
 class ConvergenceVisualizer:
-    def __init__(self, config: Optional[VisualizerConfig] = None):
-        """Initialize the visualizer with optional configuration"""
+    def __init__(self, config: Optional[VisualizerConfig] = None,
+                 source: Optional[RingReader] = None):
+        """
+        Initialize the visualizer with optional configuration
+
+        Args:
+            config: Visualizer configuration
+            source: Shared chaos game producer whose vertex choices drive
+                the point and its twin instead of a private random stream
+        """
         self.config = config or VisualizerConfig()
+        self.source = source
+        self.pending_choices: np.ndarray = np.zeros(0, dtype=np.uint8)
         self.vertices: np.ndarray = np.array([[0, 0], [1, 0], [0.5, 0.866]])
+        if source is not None:
+            self.vertices = np.array(source.vertices)
         self.point_off: np.ndarray = np.array([0.4, 0.4])
         self.points_off: List[np.ndarray] = [self.point_off]
         self.points_on: List[np.ndarray] = []
@@ -47,43 +73,126 @@ class ConvergenceVisualizer:
     def find_twin_point(self, point: np.ndarray) -> np.ndarray:
         """
         Find the closest point on the Sierpinski triangle.
-        
+
+        Same as find_twin_points for a single point, so the interactive view
+        and run_ensemble pair a start point with the same twin (points
+        outside edge CA are projected onto CA, not onto AB or BC).
+
         Args:
             point: 2D point coordinates
         Returns:
             Closest point on the triangle
         """
-        # First check if point is inside triangle
-        def point_in_triangle(pt, triangle):
-            A, B, C = triangle
-            v0, v1, v2 = C - A, B - A, pt - A
-            dot00 = np.dot(v0, v0)
-            dot01 = np.dot(v0, v1)
-            dot02 = np.dot(v0, v2)
-            dot11 = np.dot(v1, v1)
-            dot12 = np.dot(v1, v2)
-            inv_denom = 1 / (dot00 * dot11 - dot01 * dot01)
-            u = (dot11 * dot02 - dot01 * dot12) * inv_denom
-            v = (dot00 * dot12 - dot01 * dot02) * inv_denom
-            return u >= 0 and v >= 0 and u + v <= 1
+        return self.find_twin_points(np.asarray(point, dtype=float)[None])[0]
+
+    def find_twin_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Twin points for an (n, 2) array of points.
 
-        if point_in_triangle(point, self.vertices):
-            # Use midpoints of closest subdivision
-            midpoints = (self.vertices + np.roll(self.vertices, -1, axis=0)) / 2
-            all_points = np.vstack([self.vertices, midpoints])
-            distances = np.linalg.norm(all_points - point, axis=1)
-            return all_points[np.argmin(distances)]
+        Points outside the triangle are projected onto the nearest of all
+        three edges.
+
+        Args:
+            points: Array of 2D points
+        Returns:
+            Array of closest points on the triangle, one per input point
+        """
+        A, B, C = self.vertices
+        v0, v1 = C - A, B - A
+        v2 = points - A
+        dot00, dot01, dot11 = v0 @ v0, v0 @ v1, v1 @ v1
+        dot02, dot12 = v2 @ v0, v2 @ v1
+        inv_denom = 1 / (dot00 * dot11 - dot01 * dot01)
+        u = (dot11 * dot02 - dot01 * dot12) * inv_denom
+        v = (dot00 * dot12 - dot01 * dot02) * inv_denom
+        inside = (u >= 0) & (v >= 0) & (u + v <= 1)
+
+        # Inside: closest vertex or edge midpoint
+        midpoints = (self.vertices + np.roll(self.vertices, -1, axis=0)) / 2
+        candidates = np.vstack([self.vertices, midpoints])
+        nearest = np.linalg.norm(points[:, None] - candidates, axis=2).argmin(axis=1)
+        twins = candidates[nearest]
+
+        # Outside: projection onto the nearest edge
+        starts = self.vertices
+        edges = np.roll(self.vertices, -1, axis=0) - starts
+        t = np.einsum('nkd,kd->nk', points[:, None] - starts, edges) / np.sum(edges ** 2, axis=1)
+        proj = starts + np.clip(t, 0, 1)[..., None] * edges
+        closest = np.linalg.norm(proj - points[:, None], axis=2).argmin(axis=1)
+        twins[~inside] = proj[~inside, closest[~inside]]
+        return twins
+
+    def run_ensemble(self, trajectories: int = 1_000_000, iterations: int = 50,
+                     percentiles: Tuple[float, ...] = (5, 25, 50, 75, 95),
+                     seed: Optional[int] = None) -> EnsembleResult:
+        """
+        Advance many (point, twin) pairs at once without any visualization.
+
+        Starting points are drawn uniformly from the plotted area, each pair
+        moves towards the same random vertex, and all pairs advance with one
+        array operation per iteration.
+
+        Args:
+            trajectories: Number of (point, twin) pairs
+            iterations: Number of chaos game steps
+            percentiles: Distance percentiles recorded per iteration
+            seed: Seed for the random generator
+        Returns:
+            Per-iteration distance statistics and the fitted contraction rate
+        """
+        rng = np.random.default_rng(seed)
+        start_time = time.perf_counter()
+        points = rng.uniform((-0.1, -0.1), (1.1, 1.0), size=(trajectories, 2))
+        twins = self.find_twin_points(points)
+
+        distances = np.empty((iterations + 1, len(percentiles)))
+        geometric_mean = np.empty(iterations + 1)
+        for i in range(iterations + 1):
+            if i > 0:
+                chosen = self.vertices.take(rng.integers(3, size=trajectories, dtype=np.uint8), axis=0)
+                points += chosen
+                points *= 0.5
+                twins += chosen
+                twins *= 0.5
+            diff = points - twins
+            squared = np.einsum('ij,ij->i', diff, diff)
+            distances[i] = np.percentile(np.sqrt(squared), percentiles)
+            positive = squared[squared > 0]
+            geometric_mean[i] = np.exp(0.5 * np.log(positive).mean()) if len(positive) else 0.0
+
+        # Least-squares fit of log distance against the iteration number,
+        # ignoring iterations where distances reached floating point resolution
+        valid = geometric_mean > 1e3 * np.finfo(float).eps
+        if np.count_nonzero(valid) >= 2:
+            slope = np.polyfit(np.arange(iterations + 1)[valid], np.log(geometric_mean[valid]), 1)[0]
+            contraction_rate = float(np.exp(slope))
+            half_life = float(np.log(0.5) / slope) if slope < 0 else float('inf')
         else:
-            # Project onto nearest edge
-            edges = np.array([self.vertices, np.roll(self.vertices, -1, axis=0)])
-            proj_points = []
-            for edge in edges:
-                v = edge[1] - edge[0]
-                t = max(0, min(1, np.dot(point - edge[0], v) / np.dot(v, v)))
-                proj = edge[0] + t * v
-                proj_points.append(proj)
-            distances = [np.linalg.norm(p - point) for p in proj_points]
-            return proj_points[np.argmin(distances)]
+            # A line needs at least two iterations above floating point resolution
+            contraction_rate = half_life = float('nan')
+        seconds = time.perf_counter() - start_time
+        logger.info(f"Ensemble of {trajectories:,} trajectories x {iterations} iterations "
+                    f"took {seconds:.2f} s")
+        return EnsembleResult(
+            percentiles=tuple(percentiles),
+            distances=distances,
+            geometric_mean=geometric_mean,
+            contraction_rate=contraction_rate,
+            half_life=half_life,
+            trajectories=trajectories,
+            seconds=seconds
+        )
+
+    def next_choices(self, count: int) -> np.ndarray:
+        """Next vertex choices, taken from the shared producer when one is attached"""
+        if self.source is None:
+            return np.random.randint(3, size=count)
+        if len(self.pending_choices) < count:
+            # Only the choices are needed, copy them out of the newest batches
+            fresh = [choices.copy() for _, choices in self.source.poll()]
+            self.pending_choices = np.concatenate([self.pending_choices, *fresh])[-self.config.max_points:]
+        choices, self.pending_choices = self.pending_choices[:count], self.pending_choices[count:]
+        return choices
 
     def calculate_rolling_average(self, data: List[float], window: int) -> np.ndarray:
         """Calculate rolling average of distances"""
@@ -164,7 +273,7 @@ class ConvergenceVisualizer:
                 
                 try:
                     vertices_batch = self.vertices[
-                        np.random.randint(3, size=self.config.points_per_frame)
+                        self.next_choices(self.config.points_per_frame)
                     ]
                     new_points_off = (self.point_off + vertices_batch) / 2
                     new_points_on = (self.twin_point + vertices_batch) / 2
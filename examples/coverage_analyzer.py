@@ -4,8 +4,12 @@ from matplotlib.animation import FuncAnimation
 from matplotlib.patches import Circle, Polygon
 from matplotlib.colors import LogNorm
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
+from statistics import NormalDist
 import logging
+import time
+
+from sierpinski.shared import RingReader
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,11 +24,205 @@ class AnalyzerConfig:
     epsilon: float = 0.01
     figure_size: Tuple[int, int] = (15, 5)
 
+@dataclass
+class HittingTimeResult:
+    """First-entry statistics of the walkers for one (target, epsilon) pair"""
+    target: np.ndarray
+    epsilon: float
+    times: np.ndarray  # First entry step per walker, -1 if not reached within max_steps
+    mean: float  # Mean over all walkers, NaN if any is censored
+    ci_low: float
+    ci_high: float
+    median: float  # NaN if half or more of the walkers are censored
+    censored: int  # Walkers that did not reach the ball within max_steps
+    histogram: Tuple[np.ndarray, np.ndarray]  # (counts, bin edges)
+    analytic_mean: float  # Address-based upper bound for comparison
+    address_depth: int  # Length of the cell addresses used by analytic_mean
+
+class HittingTimeEngine:
+    """Monte Carlo first-entry times of many chaos game walkers run in lockstep"""
+
+    def __init__(self, vertices: np.ndarray, walkers: int = 100_000,
+                 max_steps: int = 100_000, confidence: float = 0.95,
+                 bins: int = 50, burn_in: int = 64, seed: Optional[int] = None):
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.walkers = walkers
+        self.burn_in = burn_in
+        self.max_steps = max_steps
+        self.confidence = confidence
+        self.bins = bins
+        self.rng = np.random.default_rng(seed)
+        self.diameter = max(np.linalg.norm(a - b) for a in self.vertices for b in self.vertices)
+
+    def cells_in_ball(self, target: np.ndarray, epsilon: float, depth: int) -> np.ndarray:
+        """
+        Addresses of all depth-level sub-triangles that lie inside the ball.
+
+        Cells are subdivided level by level and a cell is dropped as soon as
+        its circumscribing disk misses the ball. A triangle is inside the
+        (convex) ball when its three corners are.
+
+        Returns:
+            (m, depth) array of ternary digits, the outermost first
+        """
+        target = np.asarray(target, dtype=float)
+        corners = self.vertices[None]
+        words = np.zeros((1, 0), dtype=np.int64)
+        for _ in range(depth):
+            # Child i of a cell has corners (c[j] + c[i]) / 2
+            corners = ((corners[:, None] + corners[:, :, None]) / 2).reshape(-1, 3, 2)
+            words = np.column_stack([np.repeat(words, 3, axis=0), np.tile(np.arange(3), len(words))])
+            centres = corners.mean(axis=1)
+            radii = np.linalg.norm(corners - centres[:, None], axis=2).max(axis=1)
+            near = np.linalg.norm(centres - target, axis=1) - radii < epsilon
+            corners, words = corners[near], words[near]
+        inside = np.all(np.linalg.norm(corners - target, axis=2) < epsilon, axis=1)
+        return words[inside]
+
+    def analytic_mean(self, target: np.ndarray, epsilon: float,
+                      refinement: int = 3) -> Tuple[float, int]:
+        """
+        Expected hitting time of the union of the address cells inside the ball.
+
+        After step n the walker lies in the sub-triangle whose address is
+        its last choices in reverse order, so entering one of the depth-k
+        cells inside the ball is waiting for any of a set of patterns of k
+        uniform ternary symbols. With the correlations
+        C[i, j] = sum of 3**l over all l where the length-l suffix of
+        pattern i equals the length-l prefix of pattern j, the mean E and
+        the probabilities p of each pattern appearing first solve
+        p @ C = E and sum(p) = 1 (Guibas and Odlyzko). The cells are
+        refinement levels finer than the ball, so their union covers most
+        of the attractor inside it. For a walker on the attractor this
+        bounds the mean hitting time of the epsilon-ball from above; it is
+        infinite if no cell fits in the ball.
+        """
+        depth = max(1, int(np.ceil(np.log2(self.diameter / epsilon)))) + refinement
+        patterns = self.cells_in_ball(target, epsilon, depth)[:, ::-1]
+        m = len(patterns)
+        if m == 0:
+            return float('inf'), depth
+        correlation = np.zeros((m, m))
+        for length in range(1, depth + 1):
+            overlap = np.all(patterns[:, None, -length:] == patterns[None, :, :length], axis=2)
+            correlation += overlap * 3.0 ** length
+        # Unknowns (p_1 .. p_m, E)
+        system = np.zeros((m + 1, m + 1))
+        system[:m, :m] = correlation.T
+        system[:m, m] = -1
+        system[m, :m] = 1
+        rhs = np.zeros(m + 1)
+        rhs[m] = 1
+        return float(np.linalg.solve(system, rhs)[m]), depth
+
+    def run(self, targets: Sequence[np.ndarray],
+            epsilons: Sequence[float]) -> List[HittingTimeResult]:
+        """
+        Run all walkers until each one has entered every (target, epsilon) ball.
+
+        Walkers advance together as arrays. A walker is retired as soon as
+        it has entered all balls, so later steps only touch walkers still
+        searching.
+
+        Args:
+            targets: Target points
+            epsilons: Ball radii, every target is combined with every radius
+        Returns:
+            One result per (target, epsilon) pair, targets varying slowest
+        """
+        targets = np.atleast_2d(np.asarray(targets, dtype=float))
+        eps_squared = np.asarray(epsilons, dtype=float) ** 2
+        pairs = len(targets) * len(eps_squared)
+        start_time = time.perf_counter()
+
+        times = np.full((self.walkers, pairs), -1, dtype=np.int64)
+        # Start inside the triangle and burn in, as chaos_game does, so the
+        # timed steps start on the attractor
+        positions = self.rng.dirichlet(np.ones(3), size=self.walkers) @ self.vertices
+        for _ in range(self.burn_in):
+            choices = self.rng.integers(3, size=self.walkers, dtype=np.uint8)
+            positions = (positions + self.vertices.take(choices, axis=0)) / 2
+        active = np.arange(self.walkers)
+        pending = np.ones((self.walkers, pairs), dtype=bool)
+
+        for step in range(1, self.max_steps + 1):
+            if len(active) == 0:
+                break
+            choices = self.rng.integers(3, size=len(active), dtype=np.uint8)
+            positions = (positions + self.vertices.take(choices, axis=0)) / 2
+
+            diff = positions[:, None, :] - targets
+            dist_squared = np.einsum('wtd,wtd->wt', diff, diff)
+            inside = (dist_squared[:, :, None] < eps_squared).reshape(len(active), pairs)
+            entered = inside & pending
+            if entered.any():
+                rows, cols = np.nonzero(entered)
+                times[active[rows], cols] = step
+                pending &= ~inside
+                # Retire walkers that have entered every ball
+                searching = pending.any(axis=1)
+                if not searching.all():
+                    active = active[searching]
+                    positions = positions[searching]
+                    pending = pending[searching]
+
+        logger.info(f"Hitting times for {self.walkers:,} walkers and {pairs} balls "
+                    f"took {time.perf_counter() - start_time:.2f} s")
+        results = []
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        for pair in range(pairs):
+            target = targets[pair // len(eps_squared)]
+            epsilon = float(np.sqrt(eps_squared[pair % len(eps_squared)]))
+            pair_times = times[:, pair]
+            hit = pair_times[pair_times >= 0]
+            censored = self.walkers - len(hit)
+            # Censored walkers take longer than max_steps, so the median is
+            # still known while fewer than half of them are censored
+            median = float(np.median(np.where(pair_times >= 0, pair_times, np.inf)))
+            if not np.isfinite(median):
+                median = float('nan')
+            # The mean is only known if every walker reached the ball
+            if censored == 0:
+                mean = float(hit.mean())
+                half_width = z * float(hit.std(ddof=1)) / np.sqrt(len(hit)) if len(hit) > 1 else 0.0
+            else:
+                mean = half_width = float('nan')
+            if len(hit):
+                histogram = np.histogram(hit, bins=self.bins)
+            else:
+                histogram = (np.zeros(self.bins, dtype=np.int64), np.linspace(0, self.max_steps, self.bins + 1))
+            analytic, depth = self.analytic_mean(target, epsilon)
+            results.append(HittingTimeResult(
+                target=target,
+                epsilon=epsilon,
+                times=pair_times,
+                mean=mean,
+                ci_low=mean - half_width,
+                ci_high=mean + half_width,
+                median=median,
+                censored=int(censored),
+                histogram=histogram,
+                analytic_mean=analytic,
+                address_depth=depth
+            ))
+        return results
+
 class CoverageAnalyzer:
-    def __init__(self, config: Optional[AnalyzerConfig] = None):
-        """Initialize the analyzer with optional configuration"""
+    def __init__(self, config: Optional[AnalyzerConfig] = None,
+                 source: Optional[RingReader] = None):
+        """
+        Initialize the analyzer with optional configuration
+
+        Args:
+            config: Analyzer configuration
+            source: Shared chaos game producer to read points from instead
+                of running a private chaos game
+        """
         self.config = config or AnalyzerConfig()
+        self.source = source
         self.vertices: np.ndarray = np.array([[0, 0], [1, 0], [0.5, 0.866]])
+        if source is not None:
+            self.vertices = np.array(source.vertices)
         self.points: List[np.ndarray] = []
         self.current_point: np.ndarray = np.random.rand(2)
         self.target_point: np.ndarray = np.array([0.333, 0.289])
@@ -53,8 +251,44 @@ class CoverageAnalyzer:
         
         np.add.at(self.coverage_grid, (y[mask], x[mask]), 1)
 
+    def hitting_times(self, walkers: int = 100_000, max_steps: int = 100_000,
+                      targets: Optional[Sequence[np.ndarray]] = None,
+                      epsilons: Optional[Sequence[float]] = None,
+                      seed: Optional[int] = None) -> List[HittingTimeResult]:
+        """
+        Hitting-time distributions for a grid of (target, epsilon) balls.
+
+        Defaults to the analyzer's own target point and epsilon.
+        """
+        engine = HittingTimeEngine(self.vertices, walkers=walkers,
+                                   max_steps=max_steps, seed=seed)
+        if targets is None:
+            targets = [self.target_point]
+        if epsilons is None:
+            epsilons = [self.config.epsilon]
+        return engine.run(targets, epsilons)
+
+    def step_from_source(self) -> None:
+        """Consume every batch published by the shared producer since the last call"""
+        eps_squared = self.config.epsilon ** 2
+        for new_points in self.source.points():
+            # new_points is a view into shared memory, copy only what is kept
+            diff = new_points - self.target_point
+            near = np.einsum('ij,ij->i', diff, diff) < eps_squared
+            self.found_points.extend(new_points[near])
+            recent = new_points[-self.config.buffer_size:].copy()
+            keep = self.config.buffer_size - len(recent)
+            self.points = (self.points[-keep:] if keep > 0 else []) + list(recent)
+            self.current_point = recent[-1]
+            self.total_iterations += len(new_points)
+            self.visits_near_target.append(len(self.found_points))
+            self.update_coverage(new_points)
+
     def step(self) -> None:
         """Perform one iteration of the chaos game"""
+        if self.source is not None:
+            self.step_from_source()
+            return
         try:
             # Vectorized point generation
             vertices_batch = self.vertices[
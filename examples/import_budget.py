@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from statistics import median
+from typing import List
+
+# Import and headless generation must stay within these budgets (median of runs)
+IMPORT_BUDGET_MS = 250.0
+GENERATE_BUDGET_MS = 100.0
+
+# Runs in a fresh interpreter, so nothing is already imported
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import sierpinski
+imported = time.perf_counter()
+pyramid = sierpinski.SierpinskiPyramid(iterations=4)
+pyramid.tetrahedra()
+sierpinski.chaos_game(sierpinski.TRIANGLE_VERTICES, 100_000, seed=0)
+generated = time.perf_counter()
+heavy = [name for name in ('matplotlib', 'plotly') if name in sys.modules]
+print((imported - start) * 1000, (generated - imported) * 1000, ','.join(heavy))
+"""
+
+
+@dataclass
+class BudgetReport:
+    import_ms: float
+    generate_ms: float
+    heavy_modules: List[str]
+
+    @property
+    def within_budget(self) -> bool:
+        return (self.import_ms <= IMPORT_BUDGET_MS
+                and self.generate_ms <= GENERATE_BUDGET_MS
+                and not self.heavy_modules)
+
+
+def measure(runs: int = 5) -> BudgetReport:
+    """Measure import and headless generation time of the sierpinski package"""
+    import_times, generate_times = [], []
+    heavy: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE], check=True,
+                                capture_output=True, text=True).stdout.split()
+        import_times.append(float(output[0]))
+        generate_times.append(float(output[1]))
+        heavy = output[2].split(',') if len(output) > 2 else []
+    return BudgetReport(median(import_times), median(generate_times), heavy)
+
+
+if __name__ == "__main__":
+    report = measure()
+    print(f"import sierpinski:     {report.import_ms:7.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    print(f"headless generation:   {report.generate_ms:7.1f} ms (budget {GENERATE_BUDGET_MS:.0f} ms)")
+    print(f"plotting libs loaded:  {', '.join(report.heavy_modules) or 'none'}")
+    if not report.within_budget:
+        sys.exit("Import-time budget exceeded")
@@ -0,0 +1,40 @@
+from multiprocessing import Process
+import logging
+
+import numpy as np
+
+from sierpinski.shared import ChaosProducer, RingReader
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+VERTICES = np.array([[0, 0], [1, 0], [0.5, 0.866]])
+POINTS_PER_SECOND = 200_000
+
+
+def run_coverage(name: str) -> None:
+    from coverage_analyzer import CoverageAnalyzer
+    CoverageAnalyzer(source=RingReader(name)).visualize()
+
+
+def run_convergence(name: str) -> None:
+    from convergence_visualizer import ConvergenceVisualizer
+    ConvergenceVisualizer(source=RingReader(name)).visualize()
+
+
+def run_invariance(name: str) -> None:
+    from chaos_game import InvarianceVisualizer
+    InvarianceVisualizer(source=RingReader(name)).animate()
+
+
+VIEWERS = [run_coverage, run_convergence, run_invariance]
+
+if __name__ == "__main__":
+    # One chaos game for every window: viewers attach to the ring by name
+    with ChaosProducer(VERTICES, batch_size=2_000, points_per_second=POINTS_PER_SECOND) as producer:
+        logger.info(f"Producer ring: {producer.name}")
+        viewers = [Process(target=viewer, args=(producer.name,)) for viewer in VIEWERS]
+        for viewer in viewers:
+            viewer.start()
+        for viewer in viewers:
+            viewer.join()
@@ -0,0 +1,78 @@
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from sierpinski.core import PYRAMID_VERTICES, TRIANGLE_VERTICES, chaos_game
+from sierpinski.symmetry import symmetric_chaos_game, symmetry_group
+
+POINTS = 2_000_000
+# The symmetric sample may differ from plain sampling by at most this
+# multiple of the distance between two independent plain samples
+NOISE_FACTOR = 2.0
+
+
+@dataclass
+class SamplingReport:
+    name: str
+    group_order: int
+    plain_rate: float  # Points per second
+    symmetric_rate: float
+    distance: float  # Total variation distance between plain and symmetric histograms
+    noise: float  # Same distance between two independent plain samples
+
+    @property
+    def speedup(self) -> float:
+        return self.symmetric_rate / self.plain_rate
+
+    @property
+    def matches(self) -> bool:
+        return self.distance <= NOISE_FACTOR * self.noise
+
+
+def histogram(points: np.ndarray, vertices: np.ndarray, bins: int) -> np.ndarray:
+    """Normalized histogram over the bounding box of the vertices"""
+    ranges = list(zip(vertices.min(axis=0), vertices.max(axis=0)))
+    counts, _ = np.histogramdd(points, bins=bins, range=ranges)
+    return counts / counts.sum()
+
+
+def total_variation(p: np.ndarray, q: np.ndarray) -> float:
+    return 0.5 * float(np.abs(p - q).sum())
+
+
+def rate(sampler: Callable, vertices: np.ndarray, runs: int = 3) -> float:
+    """Median points per second of a sampler"""
+    times = []
+    for seed in range(runs):
+        start = time.perf_counter()
+        sampler(vertices, POINTS, seed=seed)
+        times.append(time.perf_counter() - start)
+    return POINTS / float(np.median(times))
+
+
+def compare(name: str, vertices: np.ndarray, bins: int) -> SamplingReport:
+    plain = histogram(chaos_game(vertices, POINTS, seed=1), vertices, bins)
+    independent = histogram(chaos_game(vertices, POINTS, seed=2), vertices, bins)
+    symmetric = histogram(symmetric_chaos_game(vertices, POINTS, seed=3), vertices, bins)
+    return SamplingReport(
+        name=name,
+        group_order=len(symmetry_group(vertices)[0]),
+        plain_rate=rate(chaos_game, vertices),
+        symmetric_rate=rate(symmetric_chaos_game, vertices),
+        distance=total_variation(plain, symmetric),
+        noise=total_variation(plain, independent)
+    )
+
+
+if __name__ == "__main__":
+    reports = [compare("triangle", TRIANGLE_VERTICES, bins=128),
+               compare("pyramid", PYRAMID_VERTICES, bins=32)]
+    for report in reports:
+        print(f"{report.name}: {report.group_order} symmetries, "
+              f"{report.plain_rate:,.0f} -> {report.symmetric_rate:,.0f} points/s ({report.speedup:.1f}x), "
+              f"TV distance {report.distance:.4f} (independent samples {report.noise:.4f})")
+    if not all(report.matches for report in reports):
+        sys.exit("Symmetric sampling does not reproduce the plain density")
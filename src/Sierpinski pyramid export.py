@@ -0,0 +1,36 @@
+import argparse
+
+from sierpinski.core import PYRAMID_VERTICES
+from sierpinski.export import ExportConfig, export_pyramid
+from sierpinski.markov import restricted_transition
+
+
+def parse_args() -> ExportConfig:
+    parser = argparse.ArgumentParser(description="Stream Sierpinski pyramid points (and optionally its mesh) to binary PLY/NPZ")
+    parser.add_argument('--points', type=int, default=ExportConfig.points)
+    parser.add_argument('--batch-size', type=int, default=ExportConfig.batch_size)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=ExportConfig.output,
+                        help="Output path without extension")
+    parser.add_argument('--format', nargs='+', choices=['ply', 'npz'], default=['ply'])
+    parser.add_argument('--voxels', type=int, default=0,
+                        help="Voxel density grid resolution (e.g. 512), 0 disables it")
+    parser.add_argument('--mesh', type=int, default=None, metavar='LEVEL',
+                        help="Also write the indexed level-LEVEL pyramid mesh as PLY")
+    parser.add_argument('--symmetric', action='store_true',
+                        help="Add the 24 symmetric images of every chaos game point")
+    parser.add_argument('--forbid', type=int, nargs='+', default=None, metavar='OFFSET',
+                        help="Restricted chaos game: never move by these vertex offsets (0 = repeat)")
+    parser.add_argument('--cache', default=None, metavar='DIR',
+                        help="Reuse points and density cached in DIR for the same --seed")
+    args = parser.parse_args()
+    transition = None if args.forbid is None else restricted_transition(len(PYRAMID_VERTICES), args.forbid)
+    return ExportConfig(points=args.points, batch_size=args.batch_size, seed=args.seed,
+                        output=args.output, formats=tuple(args.format),
+                        voxel_resolution=args.voxels, mesh_iterations=args.mesh,
+                        symmetric=args.symmetric, transition=transition, cache_dir=args.cache)
+
+
+if __name__ == "__main__":
+    report = export_pyramid(parse_args())
+    print(report.summary())
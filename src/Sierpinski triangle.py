@@ -1,12 +1,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.colors import to_rgba
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
-import random
 from numpy.typing import NDArray
 import time  # Add time import
 
+from sierpinski.address import attractor_distance, project_to_attractor
+from sierpinski.core import TRIANGLE_VERTICES, iterate_choices, random_point
+from sierpinski.markov import MarkovChoices
+from sierpinski.symmetry import apply_group, symmetry_group
+from sierpinski.shared import RingReader
+
 @dataclass
 class Config:
     initial_speed: float = 1.0
@@ -30,19 +36,34 @@ class Config:
     points_color: str = 'green'
     # Add performance settings
     batch_size: int = 1000  # Process points in batches
-    # Add triangle configuration
+    # Add triangle configuration (any polygon, e.g. sierpinski.core.regular_polygon(5))
     triangle_vertices: List[Tuple[float, float]] = None
+    # Restricted chaos game: transition[i][j] is the probability of choosing
+    # vertex j after vertex i (see sierpinski.markov.restricted_transition),
+    # None picks every vertex uniformly
+    transition: Optional[List[List[float]]] = None
     max_display_points: int = 100000  # Maximum points to display at once
     display_downsampling: float = 0.5  # Fraction of points to show when exceeding limit
+    # Incremental rendering: each frame restores a cached blit background that
+    # already holds every earlier point and draws only the points added since
+    # the last frame. All points are also rasterized into an RGBA canvas, which
+    # is drawn only on full redraws (resize, point size change, reset).
+    incremental_rendering: bool = True
+    canvas_resolution: int = 1024  # Canvas size in pixels (per side)
+    # The status window is a full figure redraw (tens of ms), refresh it at most this often
+    status_interval: float = 0.25
+    # Points farther than attractor_tolerance from the depth-attractor_depth
+    # approximation of the fractal are projected back onto it
+    attractor_depth: int = 16
+    attractor_tolerance: float = 1e-9
+    # Add the images of every new point under all symmetries of the triangle
+    # (6 for the equilateral default), one random step gives that many points
+    symmetric_sampling: bool = False
 
     def __post_init__(self):
         if self.triangle_vertices is None:
-            # Default equilateral triangle
-            self.triangle_vertices = [
-                (0.5, np.sqrt(0.75)),  # A
-                (0.0, 0.0),            # B
-                (1.0, 0.0)             # C
-            ]
+            # Default equilateral triangle (A, B, C)
+            self.triangle_vertices = [tuple(v) for v in TRIANGLE_VERTICES]
 
 class SierpinskiTriangle:
     def _setup_windows(self):
@@ -69,20 +90,131 @@ class SierpinskiTriangle:
             color=self.config.triangle_color)
         self.scatter_plot, = self.ax_anim.plot([], [], '.',
             color=self.config.points_color, markersize=self.point_size)
-        
-        # Plot the initial triangle
+        if self.config.incremental_rendering:
+            # Holds only the points not yet in the blit background
+            self.batch_plot, = self.ax_anim.plot([], [], '.',
+                color=self.config.points_color, markersize=self.point_size, animated=True)
+            self._setup_canvas()
+
+        # Plot the initial triangle (or polygon)
+        outline = np.vstack([self.vertices, self.vertices[:1]])
         self.triangle = self.ax_anim.plot(
-            [self.A[0], self.B[0], self.C[0], self.A[0]],
-            [self.A[1], self.B[1], self.C[1], self.A[1]],
+            outline[:, 0], outline[:, 1],
             color=self.config.triangle_color
         )
 
+    def _setup_canvas(self):
+        """Initialize the accumulated RGBA canvas and the blit state for incremental rendering"""
+        res = self.config.canvas_resolution
+        self.canvas = np.zeros((res, res, 4), dtype=np.uint8)
+        self.imaged = 0  # Points shown by the image artist (set_data copies the canvas)
+        self.background = None  # Axes pixels with every point up to self.blitted
+        self.blitted = 0
+        # Redrawn on every frame on top of the background, never part of it
+        self.point_plot.set_animated(True)
+        self.line_plot.set_animated(True)
+        self.canvas_color = np.round(np.array(to_rgba(self.config.points_color)) * 255).astype(np.uint8)
+        self.canvas_extent = (*self.ax_anim.get_xlim(), *self.ax_anim.get_ylim())
+        self.canvas_image = self.ax_anim.imshow(
+            self.canvas, extent=self.canvas_extent, origin='lower',
+            interpolation='nearest', zorder=1)
+        # imshow resets the limits to the image extent, keep the configured view
+        self.ax_anim.set_xlim(self.canvas_extent[0], self.canvas_extent[1])
+        self.ax_anim.set_ylim(self.canvas_extent[2], self.canvas_extent[3])
+        self._update_splat_offsets()
+
+    def _update_splat_offsets(self):
+        """Compute the pixel footprint of a single point for the current point size"""
+        # Canvas pixels per typographic point, so the canvas matches the marker size
+        bbox = self.ax_anim.get_window_extent()
+        width_pt = max(bbox.width * 72 / self.fig_anim.dpi, 1.0)
+        px_per_pt = self.config.canvas_resolution / width_pt
+        # The '.' marker is drawn as a circle of half the marker size
+        radius = 0.25 * self.point_size * px_per_pt
+        r = int(np.ceil(radius))
+        dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+        inside = (dx ** 2 + dy ** 2 <= radius ** 2) | ((dx == 0) & (dy == 0))
+        self.splat_offsets = np.column_stack((dy[inside], dx[inside]))
+
+    def _rasterize_points(self, points: NDArray):
+        """Draw points into the canvas, cost is proportional to len(points)"""
+        if len(points) == 0:
+            return
+        res = self.config.canvas_resolution
+        x0, x1, y0, y1 = self.canvas_extent
+        ix = ((points[:, 0] - x0) * (res / (x1 - x0))).astype(np.intp)
+        iy = ((points[:, 1] - y0) * (res / (y1 - y0))).astype(np.intp)
+        iy = (iy[:, None] + self.splat_offsets[:, 0]).ravel()
+        ix = (ix[:, None] + self.splat_offsets[:, 1]).ravel()
+        mask = (0 <= ix) & (ix < res) & (0 <= iy) & (iy < res)
+        self.canvas[iy[mask], ix[mask]] = self.canvas_color
+
+    def _redraw_canvas(self):
+        """Rebuild the whole canvas and request a full redraw (point size change, resize, reset)"""
+        self.canvas[:] = 0
+        self._update_splat_offsets()
+        self._rasterize_points(self.points)
+        self.canvas_image.set_data(self.canvas)
+        self.imaged = self.num_points
+        self.background = None
+        self.fig_anim.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """After a full redraw, cache the axes as the background for blitting"""
+        self.background = self.fig_anim.canvas.copy_from_bbox(self.ax_anim.bbox)
+        # Points added after the image was updated are blitted on the next frame
+        self.blitted = self.imaged
+        # Let the next full redraw (resize, expose) show every point so far
+        self.canvas_image.set_data(self.canvas)
+        self.imaged = self.num_points
+        self._blit_frame()
+
+    def _blit_frame(self):
+        """Draw the new points onto the cached background, then the current point on top"""
+        if self.background is None:
+            return  # Waiting for a full redraw
+        canvas = self.fig_anim.canvas
+        canvas.restore_region(self.background)
+        if self.num_points > self.blitted:
+            # Cost depends only on the number of new points, not on the history
+            new_points = self.points_buffer[self.blitted:self.num_points]
+            self.batch_plot.set_data(new_points[:, 0], new_points[:, 1])
+            self.ax_anim.draw_artist(self.batch_plot)
+            # Keep the outline and the help box above the points, as in a full redraw
+            for artist in (*self.triangle, self.help_box):
+                self.ax_anim.draw_artist(artist)
+            self.background = canvas.copy_from_bbox(self.ax_anim.bbox)
+            self.blitted = self.num_points
+        self.ax_anim.draw_artist(self.line_plot)
+        self.ax_anim.draw_artist(self.point_plot)
+        canvas.blit(self.ax_anim.bbox)
+
+    def _on_timer(self):
+        """Advance one frame with manual blitting (incremental rendering)"""
+        self._update_animation(None)
+        self._blit_frame()
+
+    def _animated_artists(self):
+        """Artists redrawn on every blitted frame"""
+        if self.config.incremental_rendering:
+            return self.point_plot, self.line_plot
+        return self.point_plot, self.line_plot, self.scatter_plot
+
     def _connect_events(self):
         """Connect all event handlers"""
         self.fig_anim.canvas.mpl_connect('key_press_event', self._on_key_press)
         self.fig_status.canvas.mpl_connect('key_press_event', self._on_key_press)
         self.fig_anim.canvas.mpl_connect('close_event', self._on_close)
         self.fig_status.canvas.mpl_connect('close_event', self._on_close)
+        if self.config.incremental_rendering:
+            self.fig_anim.canvas.mpl_connect('resize_event', self._on_resize)
+            self.fig_anim.canvas.mpl_connect('draw_event', self._on_draw)
+            # FuncAnimation restores the same background every frame, the
+            # incremental path grows its background, so it drives its own timer
+            self.timer = self.fig_anim.canvas.new_timer(interval=1000 // self.config.idle_frame_rate)
+            self.timer.add_callback(self._on_timer)
+            self.timer.start()
+            return
         
         # Setup animation
         self.anim = FuncAnimation(
@@ -94,36 +226,56 @@ class SierpinskiTriangle:
             blit=True
         )
 
-    def __init__(self, config: Config):
-        """Initialize the Sierpinski Triangle generator"""
+    def __init__(self, config: Config, source: Optional[RingReader] = None):
+        """Initialize the Sierpinski Triangle generator
+
+        Args:
+            config: Window configuration
+            source: Shared chaos game producer to display instead of
+                generating points in this process
+        """
         self.config = config
+        self.source = source
         self.animation_running = True
         self.current_speed = config.initial_speed
         self.point_size = config.initial_point_size
         self.point_accumulator = 0.0
         self.total_points_generated = 0  # Add total points counter
         self.last_frame_time = time.time()
+        self.last_status_time = 0.0
         self.fps = self.config.frame_rate
         
-        # Initialize vertices from config
-        self.A = np.array(config.triangle_vertices[0])
-        self.B = np.array(config.triangle_vertices[1])
-        self.C = np.array(config.triangle_vertices[2])
-        self.vertices = [self.A, self.B, self.C]
-        self.points = np.zeros((0, 2))  # Store points as NumPy array
+        # Initialize vertices from config (or from the shared producer)
+        triangle_vertices = config.triangle_vertices if source is None else source.vertices
+        self.vertices = np.array(triangle_vertices, dtype=float)
+        # Only the uniform game on a triangle converges to the Sierpinski triangle
+        self.validate_points = len(self.vertices) == 3 and config.transition is None
+        self.markov = None if config.transition is None else MarkovChoices(config.transition)
+        if config.symmetric_sampling and config.transition is not None:
+            raise ValueError("Symmetric sampling requires uniform vertex choices")
+        if source is not None and (config.transition is not None or config.symmetric_sampling):
+            raise ValueError("A shared producer runs a uniform chaos game and cannot be "
+                             "combined with a transition matrix or symmetric sampling")
+        # Preallocated point storage, so adding a batch never copies the history
+        self.points_buffer = np.zeros((config.max_points, 2))
+        self.num_points = 0
         self.display_points = np.zeros((0, 2))  # Buffer for displayed points
         
         # Initialize starting point
-        u, v = random.uniform(0, 1), random.uniform(0, 1)
-        if u + v > 1:
-            u, v = 1 - u, 1 - v
-        self.current_point = (1 - u - v) * self.A + u * self.B + v * self.C
+        self.rng = np.random.default_rng()
+        self.symmetries = symmetry_group(self.vertices) if config.symmetric_sampling else None
+        self.current_point = self._random_start()
         
         # Setup components in correct order
         self._setup_windows()
         self._setup_plots()
         self._connect_events()
-        self.update_status_text()  # Initial status update
+        self.update_status_text(force=True)  # Initial status update
+
+    @property
+    def points(self) -> NDArray:
+        """Points generated so far (a view into the preallocated buffer)"""
+        return self.points_buffer[:self.num_points]
 
     def _setup_text(self):
         """Setup status and help text"""
@@ -146,7 +298,7 @@ R    Reset"""
         self.point_plot.set_data([], [])
         self.line_plot.set_data([], [])
         self.scatter_plot.set_data([], [])
-        return self.point_plot, self.line_plot
+        return self._animated_artists()
 
     def _update_display_points(self):
         """Update display buffer with downsampled points if needed"""
@@ -158,7 +310,7 @@ R    Reset"""
         else:
             self.display_points = self.points
 
-    def update_status_text(self):
+    def update_status_text(self, force: bool = False):
         """Update status window text"""
         current_time = time.time()
         frame_time = current_time - self.last_frame_time
@@ -168,7 +320,10 @@ R    Reset"""
         if frame_time > 0:
             current_fps = 1.0 / frame_time
             self.fps = 0.9 * self.fps + 0.1 * current_fps  # Smoothing factor
-        
+        if not force and current_time - self.last_status_time < self.config.status_interval:
+            return
+        self.last_status_time = current_time
+
         status = (f'Status:\nPoints per second: {self.current_speed}\n'
                  f'Speed multiplier: {self.current_speed/self.config.initial_speed:.1f}x\n'
                  f'Point size: {self.point_size:.1f}\n'
@@ -200,72 +355,61 @@ R    Reset"""
                                 self.point_size - self.config.point_size_step)
             self._update_point_size()
         elif event.key == 'r':  # Add reset functionality
-            self.points = np.zeros((0, 2))
+            self.num_points = 0
             self.display_points = np.zeros((0, 2))
+            if self.config.incremental_rendering:
+                self._redraw_canvas()
             self.total_points_generated = 0
-            u, v = random.uniform(0, 1), random.uniform(0, 1)
-            if u + v > 1:
-                u, v = 1 - u, 1 - v
-            self.current_point = (1 - u - v) * self.A + u * self.B + v * self.C
+            self.current_point = self._random_start()
         
-        self.update_status_text()
+        self.update_status_text(force=True)
 
     def _update_point_size(self):
         """Update the size of points in all plots"""
         self.point_plot.set_markersize(self.point_size * 3)  # Make current point more visible
         self.scatter_plot.set_markersize(self.point_size)
+        if self.config.incremental_rendering:
+            self.batch_plot.set_markersize(self.point_size)
+            self._redraw_canvas()
         self.fig_anim.canvas.draw_idle()  # Force redraw
 
-    def _is_point_valid(self, point: NDArray) -> bool:
-        """Check if point is within valid bounds"""
-        x, y = point
-        # Check if point is within reasonable bounds
-        return (-0.1 <= x <= 1.1) and (-0.1 <= y <= 1.1)
-
-    def _generate_next_point(self, current: NDArray) -> NDArray:
-        """Generate next point with validation"""
-        for _ in range(5):  # Try a few times if point is invalid
-            next_vertex = random.choice(self.vertices)
-            new_point = (current + next_vertex) / 2
-            if self._is_point_valid(new_point):
-                return new_point
-        # If all attempts fail, project point back into triangle
-        return self._project_to_triangle(current)
-
-    def _project_to_triangle(self, point: NDArray) -> NDArray:
-        """Project point back into triangle if it's outside"""
-        # Calculate barycentric coordinates
-        v0 = self.B - self.A
-        v1 = self.C - self.A
-        v2 = point - self.A
-        
-        d00 = np.dot(v0, v0)
-        d01 = np.dot(v0, v1)
-        d11 = np.dot(v1, v1)
-        d20 = np.dot(v2, v0)
-        d21 = np.dot(v2, v1)
-        
-        denom = d00 * d11 - d01 * d01
-        v = (d11 * d20 - d01 * d21) / denom
-        w = (d00 * d21 - d01 * d20) / denom
-        u = 1.0 - v - w
-        
-        # Clamp coordinates to ensure point is inside triangle
-        v = np.clip(v, 0, 1)
-        w = np.clip(w, 0, 1)
-        u = np.clip(u, 0, 1)
-        
-        # Normalize
-        total = u + v + w
-        u, v, w = u/total, v/total, w/total
-        
-        # Return projected point
-        return u * self.A + v * self.B + w * self.C
+    def _valid_points(self, points: NDArray) -> NDArray:
+        """Mask of the points that lie on the fractal (within the configured tolerance)"""
+        distance = attractor_distance(points, self.config.attractor_depth, self.vertices)
+        return distance <= self.config.attractor_tolerance
+
+    def _random_start(self) -> NDArray:
+        """Random point of the triangle, moved onto the fractal so no hole is ever drawn"""
+        point = random_point(self.vertices, self.rng)
+        if not self.validate_points:
+            return point
+        return self._project_to_attractor(point[None])[0]
+
+    def _generate_points(self, count: int) -> NDArray:
+        """Advance the chaos game and return the next count points with validation"""
+        steps = count if self.symmetries is None else -(-count // len(self.symmetries[0]))
+        if self.markov is None:
+            choices = self.rng.integers(len(self.vertices), size=steps)
+        else:
+            choices = self.markov.sample(steps, self.rng)
+        new_points = iterate_choices(self.vertices, choices, self.current_point)
+        valid = self._valid_points(new_points) if self.validate_points else True
+        if not np.all(valid):
+            # Only rounding drift can leave the fractal, snap those points back
+            new_points[~valid] = self._project_to_attractor(new_points[~valid])
+        self.current_point = new_points[-1]
+        if self.symmetries is not None:
+            new_points = apply_group(new_points, *self.symmetries)[:count]
+        return new_points
+
+    def _project_to_attractor(self, points: NDArray) -> NDArray:
+        """Nearest points of the fractal approximation"""
+        return project_to_attractor(points, self.config.attractor_depth, self.vertices)
 
     def _update_animation(self, frame):
         """Update animation frame"""
         if not self.animation_running:
-            return self.point_plot, self.line_plot, self.scatter_plot
+            return self._animated_artists()
 
         try:
             # Stop adding points if we reached the maximum
@@ -273,7 +417,11 @@ R    Reset"""
                 self.animation_running = False
                 print(f"Reached maximum points ({self.config.max_points:,}). Animation stopped.")
                 self.update_status_text()
-                return self.point_plot, self.line_plot, self.scatter_plot
+                return self._animated_artists()
+
+            if self.source is not None:
+                self._add_points_from_source()
+                return self._animated_artists()
 
             self.point_accumulator += self.current_speed / self.config.frame_rate
             points_to_add = int(self.point_accumulator)
@@ -283,26 +431,49 @@ R    Reset"""
                 # Limit points_to_add to not exceed max_points
                 points_to_add = min(points_to_add, self.config.max_points - len(self.points))
                 if points_to_add <= 0:
-                    return self.point_plot, self.line_plot, self.scatter_plot
-
-                # Pre-allocate array for new points
-                new_points = np.zeros((points_to_add, 2))
-                
-                for i in range(points_to_add):
-                    self.current_point = self._generate_next_point(self.current_point)
-                    new_points[i] = self.current_point
-                    self.total_points_generated += 1
-
-                # Efficiently concatenate arrays
-                self.points = np.vstack((self.points, new_points))
-                self._update_display_points()
+                    return self._animated_artists()
+
+                new_points = self._generate_points(points_to_add)
+                self.total_points_generated += points_to_add
+
+                self._append_points(new_points)
                 self._update_plots()
                 self.update_status_text()
 
-            return self.point_plot, self.line_plot, self.scatter_plot
+            return self._animated_artists()
         except Exception as e:
             print(f"Update error: {e}")
-            return self.point_plot, self.line_plot, self.scatter_plot
+            return self._animated_artists()
+
+    def _append_points(self, new_points: NDArray):
+        """Append a batch into the preallocated buffer and draw it"""
+        self.points_buffer[self.num_points:self.num_points + len(new_points)] = new_points
+        self.num_points += len(new_points)
+        if self.config.incremental_rendering:
+            self._rasterize_points(new_points)
+        else:
+            self._update_display_points()
+
+    def _add_points_from_source(self):
+        """Append every batch published by the shared producer since the last frame"""
+        added = 0
+        for new_points in self.source.points():
+            count = min(len(new_points), self.config.max_points - self.num_points)
+            if count <= 0:
+                break
+            # new_points is a view into shared memory, it is copied before any change
+            new_points = new_points[:count]
+            valid = self._valid_points(new_points) if self.validate_points else True
+            if not np.all(valid):
+                new_points = new_points.copy()
+                new_points[~valid] = self._project_to_attractor(new_points[~valid])
+            self._append_points(new_points)
+            self.current_point = new_points[-1].copy()
+            added += count
+        if added:
+            self.total_points_generated += added
+            self._update_plots()
+            self.update_status_text()
 
     # Remove _manage_points_memory since we don't need it anymore
     def _manage_points_memory(self):
@@ -312,11 +483,18 @@ R    Reset"""
     def _update_plots(self):
         """Update all plot data"""
         self.point_plot.set_data([self.current_point[0]], [self.current_point[1]])
-        if len(self.display_points) > 0:
+        if self.config.incremental_rendering:
+            # New points were already rasterized into the canvas
+            self.point_plot.set_markersize(self.point_size * 3)
+        elif len(self.display_points) > 0:
             self.scatter_plot.set_data(self.display_points[:, 0], self.display_points[:, 1])
             self.point_plot.set_markersize(self.point_size * 3)
             self.scatter_plot.set_markersize(self.point_size)
 
+    def _on_resize(self, event):
+        """Recompute the point footprint after the window is resized"""
+        self._redraw_canvas()
+
     def _on_close(self, event):
         """Handle window close event"""
         plt.close('all')
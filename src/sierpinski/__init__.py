@@ -0,0 +1,35 @@
+"""
+Sierpinski figures.
+
+The core is NumPy only; matplotlib and plotly are imported lazily by the
+plotting methods, so importing the package and generating points headless
+stays fast.
+"""
+from sierpinski.address import attractor_distance, project_to_attractor
+from sierpinski.core import (
+    PYRAMID_VERTICES,
+    TRIANGLE_VERTICES,
+    chaos_game,
+    chaos_game_batches,
+    iterate_choices,
+    regular_polygon,
+    subdivide,
+)
+from sierpinski.cache import PointCache
+from sierpinski.shapes_2d import SierpinskiTriangle
+from sierpinski.shapes_3d import SierpinskiPyramid
+
+__all__ = [
+    'PYRAMID_VERTICES',
+    'PointCache',
+    'TRIANGLE_VERTICES',
+    'SierpinskiPyramid',
+    'SierpinskiTriangle',
+    'attractor_distance',
+    'chaos_game',
+    'chaos_game_batches',
+    'iterate_choices',
+    'project_to_attractor',
+    'regular_polygon',
+    'subdivide',
+]
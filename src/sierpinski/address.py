@@ -0,0 +1,104 @@
+"""Batched address decomposition and distance to the Sierpinski triangle approximations"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional, Tuple, Union
+
+from sierpinski.core import TRIANGLE_VERTICES
+
+
+def barycentric(points: NDArray, vertices: NDArray) -> NDArray:
+    """(n, 3) barycentric coordinates of 2D points with respect to a triangle"""
+    vertices = np.asarray(vertices, dtype=float)
+    # Maps (x, y, 1) to barycentric coordinates
+    inverse = np.linalg.inv(np.vstack([vertices.T, np.ones(3)]))
+    points = np.asarray(points, dtype=float)
+    return points @ inverse[:, :2].T + inverse[:, 2]
+
+
+def _nearest_on_edges(points: NDArray, starts: NDArray, ends: NDArray) -> NDArray:
+    """Nearest point to each point on the union of segments starts[e] -> ends[e]"""
+    direction = ends - starts
+    offset = points[:, None, :] - starts
+    t = np.clip(np.einsum('ned,ed->ne', offset, direction) / np.einsum('ed,ed->e', direction, direction), 0, 1)
+    candidates = starts + t[:, :, None] * direction
+    squared = np.einsum('ned,ned->ne', candidates - points[:, None], candidates - points[:, None])
+    return candidates[np.arange(len(points)), np.argmin(squared, axis=1)]
+
+
+def attractor_distance(points: NDArray, depth: int, vertices: Optional[NDArray] = None,
+                       return_nearest: bool = False) -> Union[NDArray, Tuple[NDArray, NDArray]]:
+    """
+    Distance from each point to the depth-level Sierpinski triangle approximation.
+
+    The approximation is the union of the 3**depth filled triangles left
+    after depth midpoint subdivisions. Every point descends through its
+    address: while its largest barycentric coordinate is at least 1/2 it
+    lies in the corner copy of that vertex, and the map p -> 2p - v zooms
+    into that copy. A point whose coordinates all drop below 1/2 at level j
+    is inside the removed middle triangle of its cell. The boundary of that
+    hole belongs to every deeper approximation, so its distance is the
+    distance to the hole boundary scaled by 2**-j. Points outside the
+    triangle get their distance to the triangle, and points still inside a
+    cell after depth levels have distance 0. All points are processed
+    together, one array step per level.
+
+    Args:
+        points: (n, 2) array of points
+        depth: Number of subdivision levels
+        vertices: (3, 2) triangle corners, TRIANGLE_VERTICES by default
+        return_nearest: Also return the nearest point of the approximation
+    Returns:
+        (n,) distances, and the (n, 2) nearest points if requested
+    """
+    vertices = np.asarray(TRIANGLE_VERTICES if vertices is None else vertices, dtype=float)
+    if vertices.shape != (3, 2):
+        raise ValueError(f"Expected (3, 2) triangle vertices, got shape {vertices.shape}")
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    distances = np.zeros(len(points))
+    nearest = points.copy()
+
+    weights = barycentric(points, vertices)
+    outside = np.any(weights < 0, axis=1)
+    if np.any(outside):
+        nearest[outside] = _nearest_on_edges(points[outside], vertices, np.roll(vertices, -1, axis=0))
+        distances[outside] = np.linalg.norm(nearest[outside] - points[outside], axis=1)
+
+    # Corners of the middle (removed) triangle: the edge midpoints
+    hole = (vertices + np.roll(vertices, -1, axis=0)) / 2
+    hole_ends = np.roll(hole, -1, axis=0)
+    active = np.flatnonzero(~outside)
+    # Coordinate rows (3, n) keep every per-level operation on contiguous arrays
+    weights = np.ascontiguousarray(weights[active].T)
+    # Point = local * scale + offset, where local is the point zoomed into its
+    # cell; the offset is kept in barycentric coordinates as well
+    offset = np.zeros_like(weights)
+    scale = 1.0
+    for _ in range(depth):
+        if len(active) == 0:
+            break
+        first = weights[0] >= 0.5
+        second = ~first & (weights[1] >= 0.5)
+        third = ~first & ~second & (weights[2] >= 0.5)
+        in_hole = ~(first | second | third)
+        if np.any(in_hole):
+            local = weights[:, in_hole].T @ vertices
+            edge = _nearest_on_edges(local, hole, hole_ends)
+            index = active[in_hole]
+            nearest[index] = edge * scale + offset[:, in_hole].T @ vertices
+            distances[index] = np.linalg.norm(edge - local, axis=1) * scale
+            keep = ~in_hole
+            active, weights, offset = active[keep], weights[:, keep], offset[:, keep]
+            first, second, third = first[keep], second[keep], third[keep]
+        scale /= 2
+        for row, corner in enumerate((first, second, third)):
+            offset[row] += scale * corner
+            weights[row] *= 2
+            weights[row] -= corner
+    if return_nearest:
+        return distances, nearest
+    return distances
+
+
+def project_to_attractor(points: NDArray, depth: int, vertices: Optional[NDArray] = None) -> NDArray:
+    """Nearest point of the depth-level approximation for each point"""
+    return attractor_distance(points, depth, vertices, return_nearest=True)[1]
@@ -0,0 +1,230 @@
+"""Content-addressed on-disk cache for chaos game point sets and density grids"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Callable, Dict, List, Optional
+import glob
+import hashlib
+import json
+import os
+
+from sierpinski.core import CHUNK, _chunk_choices, iterate_choices, random_point
+from sierpinski.export import VoxelDensity
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'SIERPINSKI_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'sierpinski'))
+DEFAULT_MAX_BYTES = 4 * 2**30
+
+
+def _initial_origin(vertices: NDArray, seed: int, ratio: float, burn_in: int) -> NDArray:
+    """Point preceding the first chunk: random start point after the burn-in"""
+    rng = np.random.default_rng(seed)
+    current = random_point(vertices, rng)
+    if burn_in > 0:
+        choices = rng.integers(len(vertices), size=burn_in, dtype=np.uint8)
+        current = iterate_choices(vertices, choices, current, ratio)[-1]
+    return current
+
+
+def _generate(vertices: NDArray, seed: int, ratio: float, begin: int, end: int,
+              origin: NDArray, consume: Callable[[int, NDArray], None]) -> NDArray:
+    """
+    Generate trajectory points begin..end-1 chunk by chunk.
+
+    Args:
+        origin: Point preceding the chunk that contains index begin
+        consume: Called with (offset, points) for every generated piece
+    Returns:
+        Point preceding the chunk that contains index end
+    """
+    chunk = begin // CHUNK
+    while chunk * CHUNK < end:
+        lo = chunk * CHUNK
+        hi = min(lo + CHUNK, end)
+        choices = _chunk_choices(seed, chunk, len(vertices), hi - lo)
+        points = iterate_choices(vertices, choices, origin, ratio)
+        skip = max(begin - lo, 0)
+        consume(lo + skip, points[skip:])
+        if hi < lo + CHUNK:
+            break
+        origin = points[-1]
+        chunk += 1
+    return origin
+
+
+class PointCache:
+    """
+    Memory-mappable cache of chaos game runs, evicted by size-bounded LRU.
+
+    Entries are keyed on everything that determines the trajectory
+    (vertices, seed, contraction ratio, burn-in) plus the dtype or grid
+    resolution. The point count is not part of the key: a request for more
+    points than cached extends the cached run instead of starting over.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _key(self, kind: str, vertices: NDArray, seed: int, ratio: float,
+             burn_in: int, **extra) -> str:
+        if not isinstance(seed, (int, np.integer)):
+            raise TypeError(f"PointCache needs an integer seed to reproduce a run, got {seed!r}")
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(vertices, dtype='<f8').tobytes())
+        digest.update(np.asarray(vertices.shape, dtype='<i8').tobytes())
+        params = dict(kind=kind, seed=int(seed), ratio=float(ratio), burn_in=int(burn_in),
+                      chunk=CHUNK, **extra)
+        digest.update(json.dumps(params, sort_keys=True).encode())
+        return digest.hexdigest()[:32]
+
+    def _path(self, key: str, count: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}-{count}{suffix}")
+
+    def _entries(self, key: str) -> List[Dict]:
+        """Metadata of all cached counts for a key, largest count first"""
+        entries = []
+        for meta_path in glob.glob(os.path.join(self.directory, f"{key}-*.json")):
+            try:
+                with open(meta_path) as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(entries, key=lambda meta: meta['count'], reverse=True)
+
+    def _store(self, key: str, count: int, array: Optional[NDArray], origin: NDArray) -> str:
+        """Write (or finalize) an entry; the metadata file marks it as complete"""
+        data_path = self._path(key, count, '.npy')
+        if array is not None:
+            tmp_path = self._path(key, count, '.npy.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, data_path)
+        meta = dict(key=key, count=count, origin=[float(x) for x in origin])
+        tmp_path = self._path(key, count, '.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._path(key, count, '.json'))
+        return data_path
+
+    def _remove(self, key: str, count: int) -> None:
+        for suffix in ('.json', '.npy'):
+            try:
+                os.remove(self._path(key, count, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _open(self, key: str, count: int) -> NDArray:
+        os.utime(self._path(key, count, '.json'))  # Mark as recently used
+        return np.load(self._path(key, count, '.npy'), mmap_mode='r')
+
+    def points(self, vertices: NDArray, n: int, seed: int, dtype=np.float64,
+               ratio: float = 0.5, burn_in: int = 64) -> NDArray:
+        """
+        First n points of the seeded chaos game run, as a read-only memory map.
+
+        Args:
+            vertices: (k, d) array of vertices
+            n: Number of points
+            seed: Integer seed of the run
+            dtype: Storage dtype of the points
+            ratio: Contraction ratio towards the chosen vertex
+            burn_in: Initial steps discarded while the start point converges
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        dtype = np.dtype(dtype)
+        key = self._key('points', vertices, seed, ratio, burn_in, dtype=dtype.str)
+        entries = self._entries(key)
+        if entries and entries[0]['count'] >= n:
+            return self._open(key, entries[0]['count'])[:n]
+
+        data_path = self._path(key, n, '.npy')
+        tmp_path = data_path + '.tmp'
+        out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=(n, vertices.shape[1]))
+        if entries:
+            # Reuse the cached prefix and continue the same trajectory
+            begin = entries[0]['count']
+            out[:begin] = self._open(key, begin)
+            origin = np.array(entries[0]['origin'])
+        else:
+            begin = 0
+            origin = _initial_origin(vertices, seed, ratio, burn_in)
+
+        def consume(offset: int, points: NDArray) -> None:
+            out[offset:offset + len(points)] = points
+
+        origin = _generate(vertices, seed, ratio, begin, n, origin, consume)
+        out.flush()
+        del out
+        os.replace(tmp_path, data_path)
+        self._store(key, n, None, origin)
+        for meta in entries:
+            self._remove(key, meta['count'])
+        self._evict(keep=key)
+        return self._open(key, n)
+
+    def density(self, vertices: NDArray, n: int, seed: int, resolution: int,
+                ratio: float = 0.5, burn_in: int = 64,
+                points: Optional[NDArray] = None) -> NDArray:
+        """
+        Hit counts of the first n points on a resolution**d grid over the vertex bounding box.
+
+        A grid cached for fewer points of the same run is extended with the
+        missing points only. If points holds the first n points of the run
+        (e.g. from points()), they are counted instead of running the chaos
+        game again.
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        key = self._key('density', vertices, seed, ratio, burn_in, resolution=int(resolution))
+        entries = [meta for meta in self._entries(key) if meta['count'] <= n]
+        if entries and entries[0]['count'] == n:
+            return self._open(key, n)
+
+        density = VoxelDensity(resolution, vertices.min(axis=0), vertices.max(axis=0))
+        if entries:
+            begin = entries[0]['count']
+            density.grid[:] = self._open(key, begin)
+            origin = np.array(entries[0]['origin'])
+        else:
+            begin = 0
+            origin = _initial_origin(vertices, seed, ratio, burn_in)
+
+        if points is None:
+            origin = _generate(vertices, seed, ratio, begin, n, origin,
+                               lambda offset, batch: density.add(batch))
+        else:
+            for lo in range(begin, n, CHUNK):
+                density.add(points[lo:min(lo + CHUNK, n)])
+            # Same origin _generate returns: the point preceding the chunk that contains n
+            last = n // CHUNK * CHUNK
+            if last > 0:
+                origin = np.asarray(points[last - 1], dtype=float)
+        self._store(key, n, density.grid, origin)
+        self._evict(keep=key)
+        return self._open(key, n)
+
+    def size(self) -> int:
+        """Total size of all cached files in bytes"""
+        return sum(os.path.getsize(path) for path in glob.glob(os.path.join(self.directory, '*-*.*')))
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for meta_path in glob.glob(os.path.join(self.directory, '*-*.json')):
+            key, count = os.path.basename(meta_path)[:-len('.json')].rsplit('-', 1)
+            data_path = self._path(key, int(count), '.npy')
+            size = os.path.getsize(meta_path) + (os.path.getsize(data_path) if os.path.exists(data_path) else 0)
+            entries.append((os.path.getmtime(meta_path), key, int(count), size))
+        total = sum(entry[3] for entry in entries)
+        for _, key, count, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(key, count)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for path in glob.glob(os.path.join(self.directory, '*-*.*')):
+            os.remove(path)
@@ -0,0 +1,238 @@
+"""NumPy-only chaos game and subdivision primitives (no plotting imports)"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Iterator, Optional, Tuple, Union
+
+from sierpinski.markov import MarkovChoices
+
+# Default equilateral triangle, same as Config in 'Sierpinski triangle.py'
+TRIANGLE_VERTICES = np.array([
+    [0.5, np.sqrt(0.75)],  # A
+    [0.0, 0.0],            # B
+    [1.0, 0.0]             # C
+])
+
+# Regular tetrahedron used by 'Sierpinski pyramid.py'
+PYRAMID_VERTICES = np.array([
+    [0.5, np.sqrt(0.75), 0.0],                            # A
+    [0.0, 0.0, 0.0],                                      # B
+    [1.0, 0.0, 0.0],                                      # C
+    [0.5, (1 / 6) * np.sqrt(3), np.sqrt(2) / np.sqrt(3)]  # D
+])
+
+# Vertex indices of the four faces of a tetrahedron
+TETRAHEDRON_FACES = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]])
+
+Seed = Union[None, int, np.random.Generator]
+
+# Uniform vertex choices of integer-seeded runs come in chunks, chunk i from
+# its own seed sequence, so any range of a run can be regenerated without
+# replaying earlier chunks (see PointCache)
+CHUNK = 1 << 20
+
+
+def regular_polygon(sides: int) -> NDArray:
+    """Vertices of a regular polygon inscribed in the unit square, with a horizontal bottom edge"""
+    # Odd polygons start with a vertex on top, even ones with a horizontal top edge
+    angles = np.pi / 2 + np.pi * (1 - sides % 2) / sides + 2 * np.pi * np.arange(sides) / sides
+    return 0.5 + 0.5 * np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+def random_point(vertices: NDArray, rng: np.random.Generator) -> NDArray:
+    """Random convex combination of the vertices (uniform on a simplex)"""
+    return rng.dirichlet(np.ones(len(vertices))) @ vertices
+
+
+def _block_length(ratio: float) -> int:
+    """Longest block whose weights ratio**-k stay below 2**32"""
+    return max(1, int(32 * np.log(2) / -np.log(ratio)))
+
+
+def iterate_choices(vertices: NDArray, choices: NDArray, start: NDArray,
+                    ratio: float = 0.5) -> NDArray:
+    """
+    Compute a chaos game trajectory for a given sequence of vertex choices.
+
+    Each step is x[t] = ratio * x[t-1] + (1 - ratio) * vertices[choices[t]].
+    The recurrence is solved in closed form inside fixed-length blocks
+    (a weighted cumulative sum) and the block start points are chained with
+    a truncated series, so no Python loop runs per point.
+
+    Args:
+        vertices: (k, d) array of vertices
+        choices: (n,) array of vertex indices
+        start: (d,) point preceding the first step
+        ratio: Contraction ratio towards the chosen vertex
+    Returns:
+        (n, d) array of generated points
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    n = len(choices)
+    d = vertices.shape[1]
+    if n == 0:
+        return np.zeros((0, d))
+    block = _block_length(ratio)
+    num_blocks = -(-n // block)
+
+    targets = np.zeros((num_blocks * block, d))
+    targets[:n] = (1 - ratio) * vertices[choices]
+    targets = targets.reshape(num_blocks, block, d)
+
+    steps = np.arange(1, block + 1)
+    shrink = (ratio ** steps)[:, None]
+    # Trajectory inside each block, as if every block started at the origin
+    partial = np.cumsum(targets / shrink, axis=1) * shrink
+
+    # Chain the blocks: s[b + 1] = ratio**block * s[b] + partial[b, -1]
+    decay = ratio ** block
+    terms = int(np.ceil(np.log(np.finfo(float).eps) / np.log(decay))) + 1
+    ends = partial[:, -1]
+    starts = np.zeros((num_blocks, d))
+    for m in range(min(terms, num_blocks - 1)):
+        starts[m + 1:] += decay ** m * ends[:num_blocks - 1 - m]
+    for b in range(min(terms + 1, num_blocks)):
+        starts[b] += decay ** b * np.asarray(start, dtype=float)
+
+    points = partial + shrink[None] * starts[:, None, :]
+    return points.reshape(-1, d)[:n]
+
+
+def _chunk_choices(seed: int, chunk: int, count: int, size: int = CHUNK) -> NDArray:
+    """First size uniform choices among count vertices of one chunk of a seeded run"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+    return rng.integers(count, size=size, dtype=np.uint8)
+
+
+def _seeded_chunks(vertices: NDArray, seed: int, total: int, origin: NDArray,
+                   ratio: float) -> Iterator[NDArray]:
+    """Points of a seeded run with uniform choices, one whole chunk at a time"""
+    for chunk in range(-(-total // CHUNK)):
+        choices = _chunk_choices(seed, chunk, len(vertices), min(CHUNK, total - chunk * CHUNK))
+        points = iterate_choices(vertices, choices, origin, ratio)
+        origin = points[-1]
+        yield points
+
+
+def chaos_game_batches(vertices: NDArray, total: int, batch_size: int,
+                       seed: Seed = None, burn_in: int = 0,
+                       ratio: float = 0.5,
+                       start: Optional[NDArray] = None,
+                       transition: Optional[NDArray] = None) -> Iterator[NDArray]:
+    """
+    Yield chaos game points in batches, starting from a random point inside the hull.
+
+    Vertices are chosen uniformly, or by the Markov chain with the given
+    transition matrix (see MarkovChoices) for restricted chaos games.
+    Uniform runs with an integer seed are computed chunk by chunk exactly
+    like PointCache, so cached and generated points are identical.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    rng = np.random.default_rng(seed)
+    current = random_point(vertices, rng) if start is None else np.asarray(start, dtype=float)
+    markov = None if transition is None else MarkovChoices(transition)
+
+    def draw(size: int) -> NDArray:
+        if markov is None:
+            return rng.integers(len(vertices), size=size, dtype=np.uint8)
+        return markov.sample(size, rng)
+
+    if burn_in > 0:
+        current = iterate_choices(vertices, draw(burn_in), current, ratio)[-1]
+    if markov is None and isinstance(seed, (int, np.integer)):
+        # Cut the chunks into batches without changing how they are computed
+        pending, held = [], 0
+        for points in _seeded_chunks(vertices, int(seed), total, current, ratio):
+            while len(points):
+                take = min(batch_size - held, len(points))
+                pending.append(points[:take])
+                held += take
+                points = points[take:]
+                if held == batch_size:
+                    yield pending[0] if len(pending) == 1 else np.concatenate(pending)
+                    pending, held = [], 0
+        if pending:
+            yield pending[0] if len(pending) == 1 else np.concatenate(pending)
+        return
+    remaining = total
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        choices = draw(size)
+        batch = iterate_choices(vertices, choices, current, ratio)
+        current = batch[-1]
+        remaining -= size
+        yield batch
+
+
+def chaos_game(vertices: NDArray, n: int, seed: Seed = None, burn_in: int = 64,
+               ratio: float = 0.5, start: Optional[NDArray] = None,
+               transition: Optional[NDArray] = None) -> NDArray:
+    """
+    Generate n chaos game points in one call.
+
+    Args:
+        vertices: (k, d) array of vertices
+        n: Number of points
+        seed: Seed or random generator
+        burn_in: Initial steps discarded while the start point converges
+        ratio: Contraction ratio towards the chosen vertex
+        start: Starting point, random inside the hull if not given
+        transition: (k, k) vertex transition matrix, uniform choices if not given
+    Returns:
+        (n, d) array of points
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    if n <= 0:
+        return np.zeros((0, vertices.shape[1]))
+    return next(chaos_game_batches(vertices, n, n, seed, burn_in, ratio, start, transition))
+
+
+def subdivide(vertices: NDArray, iterations: int) -> NDArray:
+    """
+    Corners of all sub-simplices after repeated midpoint subdivision.
+
+    Every iteration replaces each simplex by the copies scaled by 1/2
+    towards each of its corners.
+
+    Args:
+        vertices: (k, d) corners of the initial simplex
+        iterations: Number of subdivision steps
+    Returns:
+        (k**iterations, k, d) array of simplex corners
+    """
+    cells = np.asarray(vertices, dtype=float)[None]
+    for _ in range(iterations):
+        # cells[:, i] is the anchor corner of copy i, halfway to every other corner
+        cells = ((cells[:, :, None, :] + cells[:, None, :, :]) / 2).reshape(-1, *cells.shape[1:])
+    return cells
+
+
+def subdivide_indexed(vertices: NDArray, iterations: int) -> Tuple[NDArray, NDArray]:
+    """
+    Shared corners and corner indices of all sub-simplices after midpoint subdivision.
+
+    Same cells as subdivide, but every corner is stored once. Corners are
+    tracked as integer barycentric coordinates scaled by 2**iterations,
+    so the midpoints are exact and equal corners of neighbouring cells get
+    equal integer keys.
+
+    Args:
+        vertices: (k, d) corners of the initial simplex
+        iterations: Number of subdivision steps
+    Returns:
+        (m, d) array of distinct corners and (k**iterations, k) array of
+        corner indices per simplex, ordered like subdivide
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    k = len(vertices)
+    side = 2 ** iterations + 1  # Values an integer coordinate can take
+    if (k - 1) * np.log2(side) >= 63:
+        raise ValueError(f"Too many iterations ({iterations}) to index the corners exactly")
+    cells = (np.eye(k, dtype=np.int64) * 2 ** iterations)[None]
+    for _ in range(iterations):
+        cells = ((cells[:, :, None, :] + cells[:, None, :, :]) // 2).reshape(-1, k, k)
+    # The last coordinate follows from the others (they sum to 2**iterations)
+    keys = cells[..., :-1].reshape(-1, k - 1) @ side ** np.arange(k - 1, dtype=np.int64)
+    unique_keys, index = np.unique(keys, return_inverse=True)
+    coords = unique_keys[:, None] // side ** np.arange(k - 1, dtype=np.int64) % side
+    weights = np.column_stack([coords, 2 ** iterations - coords.sum(axis=1)]) / 2 ** iterations
+    return weights @ vertices, index.reshape(-1, k)
@@ -0,0 +1,268 @@
+"""Streaming binary export of pyramid point clouds and voxel densities"""
+import numpy as np
+from numpy.typing import NDArray
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import os
+import time
+import zipfile
+
+from sierpinski.core import PYRAMID_VERTICES, TETRAHEDRON_FACES, chaos_game_batches, subdivide_indexed
+from sierpinski.symmetry import symmetric_chaos_game_batches
+
+
+@dataclass
+class ExportConfig:
+    points: int = 10_000_000  # Number of chaos game points to export
+    batch_size: int = 1_000_000  # Points generated and written per batch
+    burn_in: int = 64  # Initial steps discarded (start point converging to the attractor)
+    seed: Optional[int] = None
+    output: str = "pyramid"  # Output path without extension
+    formats: Tuple[str, ...] = ("ply",)  # Any of "ply", "npz"
+    voxel_resolution: int = 0  # Side of the voxel density grid, 0 disables it
+    mesh_iterations: Optional[int] = None  # Also write the indexed level-k pyramid mesh
+    symmetric: bool = False  # Emit the orbit of every chaos game point under the symmetry group
+    transition: Optional[NDArray] = None  # Vertex transition matrix of a restricted chaos game
+    vertices: NDArray = field(default_factory=lambda: PYRAMID_VERTICES.copy())
+    cache_dir: Optional[str] = None  # Reuse points and density of a PointCache here (integer seed only)
+
+
+@dataclass
+class ExportReport:
+    points: int
+    seconds: float  # Generating and writing the points only
+    files: Dict[str, int]  # Path -> size in bytes
+    timings: Dict[str, float] = field(default_factory=dict)  # Other steps (density, mesh) in seconds
+
+    @property
+    def points_per_second(self) -> float:
+        return self.points / self.seconds if self.seconds > 0 else float('inf')
+
+    def summary(self) -> str:
+        lines = [f"Exported {self.points:,} points in {self.seconds:.2f} s "
+                 f"({self.points_per_second:,.0f} points/s)"]
+        for path, size in self.files.items():
+            lines.append(f"  {path}: {size / 2**20:,.1f} MiB")
+        for step, seconds in self.timings.items():
+            lines.append(f"  {step}: {seconds:.2f} s")
+        return "\n".join(lines)
+
+
+class PlyWriter:
+    """Streaming writer for binary little-endian PLY point clouds"""
+
+    def __init__(self, path: str, count: int):
+        self.path = path
+        self.count = count
+        self.written = 0
+        self.file = open(path, 'wb')
+        header = ("ply\n"
+                  "format binary_little_endian 1.0\n"
+                  "comment Sierpinski pyramid chaos game\n"
+                  f"element vertex {count}\n"
+                  "property float x\n"
+                  "property float y\n"
+                  "property float z\n"
+                  "end_header\n")
+        self.file.write(header.encode('ascii'))
+
+    def write(self, points: NDArray) -> None:
+        np.ascontiguousarray(points, dtype='<f4').tofile(self.file)
+        self.written += len(points)
+
+    def close(self) -> None:
+        self.file.close()
+        if self.written != self.count:
+            os.remove(self.path)
+            raise ValueError(f"{self.path}: header declares {self.count} points, "
+                             f"{self.written} were written")
+
+    def abort(self) -> None:
+        """Close and delete the partial file after a failed export"""
+        self.file.close()
+        os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_ply_mesh(path: str, points: NDArray, faces: NDArray) -> int:
+    """Write an indexed triangle mesh as binary little-endian PLY, returns the file size"""
+    header = ("ply\n"
+              "format binary_little_endian 1.0\n"
+              "comment Sierpinski pyramid mesh\n"
+              f"element vertex {len(points)}\n"
+              "property float x\n"
+              "property float y\n"
+              "property float z\n"
+              f"element face {len(faces)}\n"
+              "property list uchar int vertex_indices\n"
+              "end_header\n")
+    records = np.empty(len(faces), dtype=[('count', 'u1'), ('indices', '<i4', (3,))])
+    records['count'] = 3
+    records['indices'] = faces
+    with open(path, 'wb') as file:
+        file.write(header.encode('ascii'))
+        np.ascontiguousarray(points, dtype='<f4').tofile(file)
+        records.tofile(file)
+    return os.path.getsize(path)
+
+
+class NpzWriter:
+    """Streaming writer for an uncompressed NPZ archive holding a 'points' array"""
+
+    def __init__(self, path: str, count: int, dim: int = 3, dtype: str = '<f4',
+                 extras: Optional[Dict[str, NDArray]] = None):
+        self.path = path
+        self.count = count
+        self.dtype = np.dtype(dtype)
+        self.extras = extras or {}  # Small arrays stored next to the points on close
+        self.written = 0
+        self.archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+        self.stream = self.archive.open('points.npy', 'w', force_zip64=True)
+        header = {'descr': np.lib.format.dtype_to_descr(self.dtype),
+                  'fortran_order': False,
+                  'shape': (count, dim)}
+        np.lib.format.write_array_header_2_0(self.stream, header)
+
+    def write(self, points: NDArray) -> None:
+        data = np.ascontiguousarray(points, dtype=self.dtype)
+        self.stream.write(memoryview(data).cast('B'))
+        self.written += len(points)
+
+    def close(self) -> None:
+        if self.written != self.count:
+            self.abort()
+            raise ValueError(f"{self.path}: header declares {self.count} points, "
+                             f"{self.written} were written")
+        self.stream.close()
+        for name, array in self.extras.items():
+            with self.archive.open(f'{name}.npy', 'w', force_zip64=True) as stream:
+                np.lib.format.write_array(stream, np.asarray(array))
+        self.archive.close()
+
+    def abort(self) -> None:
+        """Close and delete the partial archive after a failed export"""
+        try:
+            # Closing a short zip stream can fail, the file is removed either way
+            self.stream.close()
+            self.archive.close()
+        except Exception:
+            pass
+        finally:
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class VoxelDensity:
+    """Voxel hit counts accumulated incrementally from batches of points (any dimension)"""
+
+    def __init__(self, resolution: int, lower: NDArray, upper: NDArray):
+        self.resolution = resolution
+        self.lower = np.asarray(lower, dtype=float)
+        self.scale = resolution / (np.asarray(upper, dtype=float) - self.lower)
+        self.grid = np.zeros((resolution,) * len(self.lower), dtype=np.uint32)
+
+    def add(self, points: NDArray) -> None:
+        idx = ((points - self.lower) * self.scale).astype(np.intp)
+        np.clip(idx, 0, self.resolution - 1, out=idx)
+        flat = np.ravel_multi_index(idx.T, self.grid.shape)
+        # Counting unique voxels keeps the update proportional to the batch size
+        voxels, counts = np.unique(flat, return_counts=True)
+        self.grid.reshape(-1)[voxels] += counts.astype(np.uint32)
+
+
+def export_pyramid(config: ExportConfig) -> ExportReport:
+    """Generate the pyramid point cloud batch by batch and stream it to disk"""
+    vertices = np.asarray(config.vertices, dtype=float)
+    for fmt in config.formats:
+        if fmt not in ('ply', 'npz'):
+            raise ValueError(f"Unknown export format: {fmt}")
+    if config.symmetric and config.transition is not None:
+        raise ValueError("Symmetric sampling requires uniform vertex choices")
+    cache = None
+    if config.cache_dir is not None:
+        if config.seed is None or config.symmetric or config.transition is not None:
+            raise ValueError("The point cache only holds seeded runs with plain uniform vertex choices")
+        from sierpinski.cache import PointCache  # Imported here, cache.py imports this module
+        cache = PointCache(config.cache_dir)
+    density = None
+    if config.voxel_resolution > 0 and cache is None:
+        density = VoxelDensity(config.voxel_resolution, vertices.min(axis=0), vertices.max(axis=0))
+
+    timings = {}
+    start_time = time.perf_counter()
+    if cache is not None:
+        # Same points as chaos_game_batches, generated only on the first export
+        cached = cache.points(vertices, config.points, config.seed, burn_in=config.burn_in)
+        batches = (cached[begin:begin + config.batch_size]
+                   for begin in range(0, config.points, config.batch_size))
+    elif config.symmetric:
+        batches = symmetric_chaos_game_batches(vertices, config.points, config.batch_size,
+                                               config.seed, config.burn_in)
+    else:
+        batches = chaos_game_batches(vertices, config.points, config.batch_size, config.seed,
+                                     config.burn_in, transition=config.transition)
+    writers = []
+    density_seconds = 0.0
+    try:
+        for fmt in config.formats:
+            if fmt == 'ply':
+                writers.append(PlyWriter(f"{config.output}.ply", config.points))
+            else:
+                writers.append(NpzWriter(f"{config.output}.npz", config.points, vertices.shape[1],
+                                         extras={'vertices': vertices}))
+        for batch in batches:
+            for writer in writers:
+                writer.write(batch)
+            if density is not None:
+                density_start = time.perf_counter()
+                density.add(batch)
+                density_seconds += time.perf_counter() - density_start
+    except BaseException:
+        # Interrupted or failed: do not leave truncated files behind
+        for writer in writers:
+            writer.abort()
+        raise
+    for writer in writers:
+        writer.close()
+    seconds = time.perf_counter() - start_time
+    paths = [writer.path for writer in writers]
+    if config.voxel_resolution > 0:
+        seconds -= density_seconds
+        density_start = time.perf_counter()
+        density_path = f"{config.output}_density.npy"
+        if cache is None:
+            np.save(density_path, density.grid)
+        else:
+            # Counted from the cached points, so a cold export runs the chaos game once
+            np.save(density_path, cache.density(vertices, config.points, config.seed,
+                                                config.voxel_resolution, burn_in=config.burn_in,
+                                                points=cached))
+        paths.append(density_path)
+        timings['density'] = density_seconds + time.perf_counter() - density_start
+    if config.mesh_iterations is not None:
+        mesh_start = time.perf_counter()
+        mesh_path = f"{config.output}_mesh.ply"
+        points, cells = subdivide_indexed(vertices, config.mesh_iterations)
+        write_ply_mesh(mesh_path, points, cells[:, TETRAHEDRON_FACES].reshape(-1, 3))
+        paths.append(mesh_path)
+        timings['mesh'] = time.perf_counter() - mesh_start
+
+    return ExportReport(points=config.points, seconds=seconds,
+                        files={path: os.path.getsize(path) for path in paths},
+                        timings=timings)
@@ -0,0 +1,105 @@
+"""Markov (restricted) vertex choices for chaos games, generated a whole batch at a time"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional, Sequence
+
+BLOCK = 1 << 20  # Steps sampled together by the general (non-circulant) path
+
+
+def restricted_transition(k: int, forbidden: Sequence[int] = ()) -> NDArray:
+    """
+    Transition matrix of the rule "never jump by a forbidden offset".
+
+    The next vertex is uniform among those whose offset from the previous
+    one (mod k) is not listed, e.g. forbidden=(0,) never repeats a vertex
+    and forbidden=(1, -1) never moves to a neighbouring vertex.
+    """
+    allowed = np.ones(k)
+    allowed[np.asarray(forbidden, dtype=int) % k] = 0
+    if not allowed.any():
+        raise ValueError("Every vertex is forbidden")
+    row = allowed / allowed.sum()
+    return np.array([np.roll(row, i) for i in range(k)])
+
+
+class MarkovChoices:
+    """
+    Vertex choices following a transition matrix, sampled in batches.
+
+    transition[i, j] is the probability of choosing vertex j right after
+    vertex i. When every row is a rotation of the first (the rule depends
+    only on the offset between consecutive vertices) the offsets are
+    independent and the choices are their cumulative sum mod k. Otherwise
+    each step is drawn as a random map state -> next state (inverse CDF
+    of every row with one shared uniform). A block of steps is cut into
+    about sqrt(block) chunks that are walked together from every possible
+    start state; then only the chunk ends are chained. Python loops run
+    O(sqrt(n)) times instead of once per step.
+    """
+
+    def __init__(self, transition: NDArray, previous: Optional[int] = None):
+        transition = np.asarray(transition, dtype=float)
+        k = len(transition)
+        if transition.shape != (k, k) or np.any(transition < 0):
+            raise ValueError("Transition matrix must be square and non-negative")
+        if np.any(transition.sum(axis=1) <= 0):
+            raise ValueError("Every row of the transition matrix needs a positive sum")
+        if not 0 < k <= 256:
+            raise ValueError(f"Unsupported number of vertices: {k}")
+        self.transition = transition / transition.sum(axis=1, keepdims=True)
+        self.cdf = np.cumsum(self.transition, axis=1)[:, :-1]
+        rotations = np.array([np.roll(self.transition[0], i) for i in range(k)])
+        self.circulant = np.allclose(rotations, self.transition)
+        self.previous = previous  # Last choice, drawn uniformly before the first batch if None
+
+    def sample(self, n: int, rng: np.random.Generator) -> NDArray:
+        """The next n choices as a uint8 array"""
+        k = len(self.transition)
+        if self.previous is None:
+            self.previous = int(rng.integers(k))
+        if n <= 0:
+            return np.zeros(0, dtype=np.uint8)
+        if self.circulant:
+            offsets = rng.choice(k, size=n, p=self.transition[0])
+            choices = (self.previous + np.cumsum(offsets)) % k
+        else:
+            choices = np.empty(n, dtype=np.int64)
+            for begin in range(0, n, BLOCK):
+                block = self._walk(rng.random(min(BLOCK, n - begin)))
+                choices[begin:begin + len(block)] = block
+                self.previous = int(block[-1])
+        self.previous = int(choices[-1])
+        return choices.astype(np.uint8)
+
+    def _walk(self, uniforms: NDArray) -> NDArray:
+        """Choices for one block of steps, starting after self.previous"""
+        k = len(self.transition)
+        m = len(uniforms)
+        length = int(np.ceil(np.sqrt(m)))  # Steps per chunk
+        chunks = -(-m // length)
+        padded = np.zeros(chunks * length)
+        padded[:m] = uniforms
+        padded = padded.reshape(chunks, length)
+        # maps[j, c, s]: next state after state s at step j of chunk c (inverse CDF of row s)
+        maps = np.zeros((length, chunks, k), dtype=np.uint8)
+        steps = np.ascontiguousarray(padded.T)
+        for state in range(k):
+            for bound in self.cdf[state]:
+                maps[:, :, state] += steps >= bound
+        maps = maps.reshape(length, chunks * k)
+        # Walk all chunks at once from every possible start state
+        rows = np.repeat(np.arange(chunks) * k, k)
+        states = np.tile(np.arange(k, dtype=np.intp), chunks)
+        walks = np.empty((length, chunks * k), dtype=np.uint8)
+        for j in range(length):
+            walks[j] = maps[j][rows + states]
+            states = walks[j].astype(np.intp)
+        walks = walks.reshape(length, chunks, k)
+        # Only the chunk ends are chained sequentially
+        ends = walks[-1].tolist()
+        starts = np.empty(chunks, dtype=np.intp)
+        state = self.previous
+        for c in range(chunks):
+            starts[c] = state
+            state = ends[c][state]
+        return walks[:, np.arange(chunks), starts].T.reshape(-1)[:m]
@@ -0,0 +1,55 @@
+"""Sierpinski triangle; matplotlib and plotly are imported only when plotting"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional
+
+from sierpinski.cache import PointCache
+from sierpinski.core import TRIANGLE_VERTICES, Seed, chaos_game, subdivide
+
+
+class SierpinskiTriangle:
+    """Sierpinski triangle approximated by repeated midpoint subdivision"""
+
+    def __init__(self, iterations: int = 6, vertices: Optional[NDArray] = None):
+        self.iterations = iterations
+        self.vertices = np.asarray(TRIANGLE_VERTICES if vertices is None else vertices, dtype=float)
+
+    def triangles(self) -> NDArray:
+        """(3**iterations, 3, 2) array with the corners of every filled triangle"""
+        return subdivide(self.vertices, self.iterations)
+
+    def sample(self, n: int, seed: Seed = None, cache: Optional[PointCache] = None) -> NDArray:
+        """n points of the attractor generated by the chaos game (the same points, served from cache for integer seeds)"""
+        if cache is not None and isinstance(seed, (int, np.integer)):
+            return cache.points(self.vertices, n, seed)
+        return chaos_game(self.vertices, n, seed)
+
+    def plot(self, color: str = 'royalblue', title: Optional[str] = None):
+        """Plotly figure with the filled triangles"""
+        import plotly.graph_objects as go
+
+        triangles = self.triangles()
+        # Closed outlines separated by None, drawn as a single filled trace
+        outlines = np.concatenate([triangles, triangles[:, :1], np.full((len(triangles), 1, 2), np.nan)], axis=1)
+        x, y = outlines.reshape(-1, 2).T
+        fig = go.Figure(go.Scatter(x=x, y=y, mode='lines', fill='toself', fillcolor=color,
+                                   line=dict(color=color, width=0.5), hoverinfo='skip'))
+        fig.update_layout(
+            title=title or f"Sierpinski Triangle ({self.iterations} iterations)",
+            showlegend=False,
+            yaxis=dict(scaleanchor='x', scaleratio=1),
+            plot_bgcolor='white'
+        )
+        return fig
+
+    def draw(self, ax=None, color: str = 'royalblue'):
+        """Draw the filled triangles on a matplotlib axes and return it"""
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PolyCollection
+
+        if ax is None:
+            _, ax = plt.subplots()
+        ax.add_collection(PolyCollection(self.triangles(), facecolors=color, edgecolors='none'))
+        ax.set_aspect('equal')
+        ax.autoscale_view()
+        return ax
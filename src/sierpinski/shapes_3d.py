@@ -0,0 +1,51 @@
+"""Sierpinski pyramid; plotly is imported only when plotting"""
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional, Tuple
+
+from sierpinski.cache import PointCache
+from sierpinski.core import (PYRAMID_VERTICES, TETRAHEDRON_FACES, Seed, chaos_game,
+                             subdivide, subdivide_indexed)
+
+
+class SierpinskiPyramid:
+    """Sierpinski pyramid (tetrahedron) approximated by repeated midpoint subdivision"""
+
+    def __init__(self, iterations: int = 4, vertices: Optional[NDArray] = None):
+        self.iterations = iterations
+        self.vertices = np.asarray(PYRAMID_VERTICES if vertices is None else vertices, dtype=float)
+
+    def tetrahedra(self) -> NDArray:
+        """(4**iterations, 4, 3) array with the corners of every tetrahedron"""
+        return subdivide(self.vertices, self.iterations)
+
+    def mesh(self) -> Tuple[NDArray, NDArray]:
+        """Indexed triangle mesh: (2 * 4**iterations + 2, 3) shared vertices and (4 * 4**iterations, 3) faces"""
+        points, cells = subdivide_indexed(self.vertices, self.iterations)
+        return points, cells[:, TETRAHEDRON_FACES].reshape(-1, 3)
+
+    def sample(self, n: int, seed: Seed = None, cache: Optional[PointCache] = None) -> NDArray:
+        """n points of the attractor generated by the chaos game (the same points, served from cache for integer seeds)"""
+        if cache is not None and isinstance(seed, (int, np.integer)):
+            return cache.points(self.vertices, n, seed)
+        return chaos_game(self.vertices, n, seed)
+
+    def plot_3d(self, color: str = 'lightpink', opacity: float = 1.0, title: Optional[str] = None):
+        """Plotly figure with all tetrahedra in a single indexed Mesh3d trace"""
+        import plotly.graph_objects as go
+
+        fig = go.Figure(mesh_trace(*self.mesh(), color=color, opacity=opacity))
+        fig.update_layout(
+            title=title or f"Sierpinski Pyramid ({self.iterations} iterations)",
+            scene=dict(aspectmode='data')
+        )
+        return fig
+
+
+def mesh_trace(points: NDArray, faces: NDArray, **kwargs):
+    """Plotly Mesh3d trace for an indexed triangle mesh"""
+    import plotly.graph_objects as go
+
+    x, y, z = points.T
+    i, j, k = faces.T
+    return go.Mesh3d(x=x, y=y, z=z, i=i, j=j, k=k, flatshading=True, **kwargs)
@@ -0,0 +1,232 @@
+"""Single chaos game producer feeding any number of viewer processes through shared memory"""
+import numpy as np
+from numpy.typing import NDArray
+from multiprocessing import Process, parent_process, resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+import time
+
+from sierpinski.core import Seed, iterate_choices, random_point
+
+MAGIC = 0x53525047  # Marks an initialized ring
+# Header slots (int64)
+_MAGIC, _SLOTS, _BATCH, _DIM, _VERTICES, _PUBLISHED, _STOP = range(7)
+_HEADER = 16  # Fixed header length, followed by one sequence number per slot
+
+_created = set()  # Names of the blocks created by this process
+
+
+class _Layout:
+    """Views into the shared block: header, ratio, vertices, points and vertex choices"""
+
+    def __init__(self, buffer, slots: int, batch_size: int, dim: int, num_vertices: int):
+        self.header = np.ndarray((_HEADER + slots,), dtype=np.int64, buffer=buffer)
+        offset = self.header.nbytes
+        self.ratio = np.ndarray((1,), dtype=np.float64, buffer=buffer, offset=offset)
+        offset += self.ratio.nbytes
+        self.vertices = np.ndarray((num_vertices, dim), dtype=np.float64, buffer=buffer, offset=offset)
+        offset += self.vertices.nbytes
+        self.points = np.ndarray((slots, batch_size, dim), dtype=np.float64, buffer=buffer, offset=offset)
+        offset += self.points.nbytes
+        self.choices = np.ndarray((slots, batch_size), dtype=np.uint8, buffer=buffer, offset=offset)
+        # sequence[slot] is the batch number stored in the slot, -1 while it is being written
+        self.sequence = self.header[_HEADER:]
+
+    @staticmethod
+    def size(slots: int, batch_size: int, dim: int, num_vertices: int) -> int:
+        return (8 * (_HEADER + slots) + 8 + 8 * num_vertices * dim
+                + 8 * slots * batch_size * dim + slots * batch_size)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without letting this process unlink it at exit"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        shm = shared_memory.SharedMemory(name=name)
+        # Processes started by multiprocessing share the creator's resource
+        # tracker, only an unrelated process has to drop its own registration
+        if parent_process() is None and name not in _created:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _produce(name: str, seed: Seed, points_per_second: Optional[float], burn_in: int) -> None:
+    """Producer process: generate batches into the ring until asked to stop"""
+    shm = _attach(name)
+    header = np.ndarray((_HEADER,), dtype=np.int64, buffer=shm.buf)
+    ring = _Layout(shm.buf, *(int(header[i]) for i in (_SLOTS, _BATCH, _DIM, _VERTICES)))
+    slots, batch_size = len(ring.points), ring.points.shape[1]
+    ratio = float(ring.ratio[0])
+    vertices = ring.vertices.copy()
+    rng = np.random.default_rng(seed)
+    current = random_point(vertices, rng)
+    if burn_in > 0:
+        # Like chaos_game, so the first published batch is already on the attractor
+        choices = rng.integers(len(vertices), size=burn_in, dtype=np.uint8)
+        current = iterate_choices(vertices, choices, current, ratio)[-1]
+    deadline = time.perf_counter()
+    batch = 0
+    try:
+        while not ring.header[_STOP]:
+            choices = rng.integers(len(vertices), size=batch_size, dtype=np.uint8)
+            points = iterate_choices(vertices, choices, current, ratio)
+            current = points[-1]
+            slot = batch % slots
+            ring.sequence[slot] = -1
+            ring.points[slot] = points
+            ring.choices[slot] = choices
+            ring.sequence[slot] = batch
+            batch += 1
+            ring.header[_PUBLISHED] = batch
+            if points_per_second:
+                deadline += batch_size / points_per_second
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+    finally:
+        del ring, header
+        shm.close()
+
+
+class ChaosProducer:
+    """
+    Runs one chaos game in a separate process and publishes it in a shared-memory ring.
+
+    Each batch is stored in the next slot of the ring together with its
+    vertex choices and a sequence number, so readers in other processes can
+    use the data in place. The producer never waits for readers: a reader
+    that falls more than `slots` batches behind skips the overwritten ones.
+    """
+
+    def __init__(self, vertices: NDArray, batch_size: int = 10_000, slots: int = 64,
+                 ratio: float = 0.5, points_per_second: Optional[float] = None,
+                 seed: Seed = None, burn_in: int = 64):
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.batch_size = batch_size
+        self.slots = slots
+        self.ratio = ratio
+        self.points_per_second = points_per_second
+        self.seed = seed
+        self.burn_in = burn_in
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self.process: Optional[Process] = None
+
+    @property
+    def name(self) -> str:
+        """Name of the shared block, passed to RingReader in viewer processes"""
+        if self.shm is None:
+            raise RuntimeError("Producer is not running")
+        return self.shm.name
+
+    def start(self) -> 'ChaosProducer':
+        num_vertices, dim = self.vertices.shape
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=_Layout.size(self.slots, self.batch_size, dim, num_vertices))
+        _created.add(self.shm.name)
+        ring = _Layout(self.shm.buf, self.slots, self.batch_size, dim, num_vertices)
+        ring.header[:] = 0
+        ring.header[_SLOTS] = self.slots
+        ring.header[_BATCH] = self.batch_size
+        ring.header[_DIM] = dim
+        ring.header[_VERTICES] = num_vertices
+        ring.ratio[0] = self.ratio
+        ring.sequence[:] = -1
+        ring.vertices[:] = self.vertices
+        ring.header[_MAGIC] = MAGIC
+        del ring
+        self.process = Process(target=_produce,
+                               args=(self.shm.name, self.seed, self.points_per_second, self.burn_in),
+                               daemon=True)
+        self.process.start()
+        return self
+
+    def stop(self) -> None:
+        if self.shm is None:
+            return
+        np.ndarray((_HEADER,), dtype=np.int64, buffer=self.shm.buf)[_STOP] = 1
+        if self.process is not None:
+            self.process.join()
+        self.shm.close()
+        self.shm.unlink()
+        _created.discard(self.shm.name)
+        self.shm = None
+        self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class RingReader:
+    """Zero-copy reader attached to a ChaosProducer ring by name"""
+
+    def __init__(self, name: str, from_start: bool = False):
+        self.shm = _attach(name)
+        header = np.ndarray((_HEADER,), dtype=np.int64, buffer=self.shm.buf)
+        if header[_MAGIC] != MAGIC:
+            self.shm.close()
+            raise ValueError(f"Shared memory block {name} is not a chaos game ring")
+        self.ring = _Layout(self.shm.buf, *(int(header[i]) for i in (_SLOTS, _BATCH, _DIM, _VERTICES)))
+        self.slots = len(self.ring.points)
+        self.vertices = self.ring.vertices  # Vertex order used by the choices
+        self.ratio = float(self.ring.ratio[0])
+        self.next = 0 if from_start else int(self.ring.header[_PUBLISHED])
+        self.lost = 0  # Batches overwritten before they could be read
+
+    @property
+    def producer_stopped(self) -> bool:
+        return bool(self.ring.header[_STOP])
+
+    def poll(self, max_batches: Optional[int] = None) -> Iterator[Tuple[NDArray, NDArray]]:
+        """
+        Yield (points, choices) views of the batches published since the last poll.
+
+        The views point into shared memory and are only valid until the
+        producer wraps around to the same slot: use them (or copy what must
+        be kept) before advancing the iterator. A batch overwritten while
+        in use is counted in `lost`.
+        """
+        published = int(self.ring.header[_PUBLISHED])
+        if published - self.next > self.slots:
+            self.lost += published - self.slots - self.next
+            self.next = published - self.slots
+        if max_batches is not None:
+            published = min(published, self.next + max_batches)
+        while self.next < published:
+            seq = self.next
+            self.next += 1
+            slot = seq % self.slots
+            if self.ring.sequence[slot] != seq:
+                self.lost += 1
+                continue
+            yield self.ring.points[slot], self.ring.choices[slot]
+            if self.ring.sequence[slot] != seq:
+                self.lost += 1
+
+    def points(self, max_batches: Optional[int] = None) -> Iterator[NDArray]:
+        """Like poll, without the vertex choices"""
+        for points, _ in self.poll(max_batches):
+            yield points
+
+    def wait(self, timeout: float = 1.0, interval: float = 0.001) -> bool:
+        """Block until a new batch is published; False on timeout"""
+        end = time.perf_counter() + timeout
+        while int(self.ring.header[_PUBLISHED]) <= self.next:
+            if time.perf_counter() >= end or self.producer_stopped:
+                return False
+            time.sleep(interval)
+        return True
+
+    def close(self) -> None:
+        """Detach from the ring; views returned by poll must not be used afterwards"""
+        self.vertices = None
+        self.ring = None
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
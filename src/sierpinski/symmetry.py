@@ -0,0 +1,90 @@
+"""Symmetry groups of vertex configurations and symmetry-amplified chaos game sampling"""
+import numpy as np
+from numpy.typing import NDArray
+from itertools import permutations
+from typing import Iterator, Optional, Tuple
+
+from sierpinski.core import Seed, chaos_game_batches
+
+MAX_PERMUTED_VERTICES = 8  # 8! permutations are still checked in well under a second
+
+
+def symmetry_group(vertices: NDArray, tolerance: float = 1e-9) -> Tuple[NDArray, NDArray]:
+    """
+    Affine isometries that map the vertex set onto itself.
+
+    Every permutation of the vertices that preserves all pairwise
+    distances is a candidate. The affine map x -> L x + t realising it is
+    fitted by least squares and kept if it reproduces the permutation. The
+    chaos game attractor and its invariant measure (uniform vertex choice)
+    are invariant under every such map.
+
+    Args:
+        vertices: (k, d) array of vertices
+        tolerance: Relative tolerance for distances and the fitted maps
+    Returns:
+        (g, d, d) linear parts and (g, d) translations, the identity first
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    k, d = vertices.shape
+    if k > MAX_PERMUTED_VERTICES:
+        raise ValueError(f"Too many vertices ({k}) to search all permutations")
+    distances = np.linalg.norm(vertices[:, None] - vertices[None], axis=-1)
+    scale = max(distances.max(), 1.0) * tolerance
+    homogeneous = np.column_stack([vertices, np.ones(k)])
+    linear, translation = [], []
+    for perm in permutations(range(k)):
+        perm = list(perm)
+        if np.abs(distances[np.ix_(perm, perm)] - distances).max() > scale:
+            continue
+        # Solve [v, 1] @ M = v[perm] for the (d + 1, d) affine matrix M
+        affine = np.linalg.lstsq(homogeneous, vertices[perm], rcond=None)[0]
+        if np.abs(homogeneous @ affine - vertices[perm]).max() > scale:
+            continue  # Permutation of a degenerate configuration without an affine map
+        linear.append(affine[:d].T)
+        translation.append(affine[d])
+    return np.array(linear), np.array(translation)
+
+
+def apply_group(points: NDArray, linear: NDArray, translation: NDArray) -> NDArray:
+    """
+    Images of every point under every group element in one matrix product.
+
+    Returns (n * g, d) points ordered point by point, so each prefix of
+    length g * m holds the full orbits of the first m points.
+    """
+    g, d = len(linear), points.shape[1]
+    # Stacking the linear parts turns all g maps into a single matrix product
+    images = (points @ linear.reshape(g * d, d).T).reshape(len(points), g, d)
+    images += translation
+    return images.reshape(-1, d)
+
+
+def symmetric_chaos_game_batches(vertices: NDArray, total: int, batch_size: int,
+                                 seed: Seed = None, burn_in: int = 0, ratio: float = 0.5,
+                                 start: Optional[NDArray] = None,
+                                 group: Optional[Tuple[NDArray, NDArray]] = None) -> Iterator[NDArray]:
+    """
+    Like chaos_game_batches, but every random step yields its whole orbit.
+
+    For a configuration with g symmetries only total / g chaos game steps
+    are run; batch_size counts output points.
+    """
+    linear, translation = symmetry_group(vertices) if group is None else group
+    order = len(linear)
+    steps = -(-total // order)
+    remaining = total
+    for batch in chaos_game_batches(vertices, steps, -(-batch_size // order),
+                                    seed, burn_in, ratio, start):
+        points = apply_group(batch, linear, translation)[:remaining]
+        remaining -= len(points)
+        yield points
+
+
+def symmetric_chaos_game(vertices: NDArray, n: int, seed: Seed = None, burn_in: int = 64,
+                         ratio: float = 0.5, start: Optional[NDArray] = None) -> NDArray:
+    """n points with the distribution of chaos_game, from about n / g random steps"""
+    vertices = np.asarray(vertices, dtype=float)
+    if n <= 0:
+        return np.zeros((0, vertices.shape[1]))
+    return next(symmetric_chaos_game_batches(vertices, n, n, seed, burn_in, ratio, start))